@@ -0,0 +1,33 @@
+"""
+Shared asyncio helper for the queues in this folder.
+
+`BatchingQueueMixin` adds `get_batch` to an `asyncio.Queue` subclass, so
+task2's `AsyncQueue` and task5's `AsyncCafeteriaQueue` drain batches
+the same way.
+"""
+
+from __future__ import annotations
+import asyncio
+from typing import Any, List, Optional
+
+
+class BatchingQueueMixin:
+    """Mixin for `asyncio.Queue` subclasses; list it before `asyncio.Queue`."""
+
+    async def get_batch(self, max_n: int, timeout: Optional[float] = None) -> List[Any]:
+        """Wait for at least one item, then return up to `max_n` items.
+
+        Returns an empty list if nothing arrives within `timeout` seconds
+        (None waits forever).  Items after the first are taken only if
+        they are already queued, so the call never waits to fill a batch.
+        """
+        if max_n <= 0:
+            raise ValueError("max_n must be positive")
+        try:
+            first = await asyncio.wait_for(self.get(), timeout)
+        except asyncio.TimeoutError:
+            return []
+        batch = [first]
+        while len(batch) < max_n and not self.empty():
+            batch.append(self.get_nowait())
+        return batch
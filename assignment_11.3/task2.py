@@ -1,18 +1,45 @@
 """
 Library request management for SRU.
 
-This module provides two queue implementations:
+This module provides four queue implementations:
 
 - Simple FIFO `Queue` for managing book borrow requests.
-- `PriorityQueue` which gives priority to faculty requests over students.
+- `HeapPriorityQueue` for any number of integer priority levels, backed
+  by a binary heap.  Lower numbers are served first and equal priorities
+  are served in arrival order.  An optional weighted-fair mode shares
+  service between levels so low priorities are never starved.
+- `PriorityQueue` which gives priority to faculty requests over students,
+  wrapping a `HeapPriorityQueue`.
+- `IndexedPriorityQueue`, a heap that also maps each request id to its
+  position, so a request can be escalated or cancelled in O(log n)
+  without rebuilding the queue.
+
+`AsyncQueue` and `AsyncPriorityQueue` expose the FIFO and faculty/student
+queues to asyncio code.  `put`/`get` are awaitable, an optional
+`maxsize` applies backpressure to producers, and `get_batch` drains
+several requests at once.
 
 Each queue supports `enqueue` and `dequeue` operations. A basic demo
-is included under `__main__`.
+is included under `__main__`; run with ``--benchmark`` to time the heap
+queue on a million requests.
 """
 
 from __future__ import annotations
+import asyncio
+import heapq
+import itertools
+import os
+import random
+import sys
+import time
 from collections import deque
-from typing import Any, Deque, List, Tuple
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    from async_batching import BatchingQueueMixin
+except ImportError:  # imported from another directory; the helper sits beside this file
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from async_batching import BatchingQueueMixin
 
 
 class Queue:
@@ -35,35 +62,160 @@ class Queue:
     def is_empty(self) -> bool:
         return not self._items
 
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._items)
+
     def __repr__(self) -> str:
         return f"Queue({list(self._items)!r})"
 
 
+class HeapPriorityQueue:
+    """Binary-heap priority queue with any number of integer levels.
+
+    Heap entries are `(key, seq, priority, item)` tuples.  `seq` comes
+    from a counter, so entries with equal keys leave in FIFO order and
+    items themselves are never compared.
+
+    In the default strict mode the key is the priority itself, so a
+    lower number is always served first.  Passing `weights` (a mapping
+    of priority to a positive share; unlisted levels get 1.0) switches
+    to weighted-fair queueing.  Each entry's key is then a virtual
+    finish time: `max(virtual clock, level's last finish) + 1 / weight`.
+    While several levels are waiting they are served in proportion to
+    their weights, so a busy high-priority level can no longer starve
+    the others.
+    """
+
+    def __init__(self, weights: Optional[Dict[int, float]] = None) -> None:
+        self._heap: List[Tuple[Any, int, int, Any]] = []
+        self._counter = itertools.count()
+        self._weights = weights
+        if weights is not None:
+            if any(w <= 0 for w in weights.values()):
+                raise ValueError("weights must be positive")
+            self._virtual_time = 0.0
+            self._last_finish: Dict[int, float] = {}
+
+    def _key(self, priority: int) -> Any:
+        if self._weights is None:
+            return priority
+        start = self._last_finish.get(priority, 0.0)
+        if start < self._virtual_time:
+            start = self._virtual_time
+        finish = start + 1.0 / self._weights.get(priority, 1.0)
+        self._last_finish[priority] = finish
+        return finish
+
+    def push(self, priority: int, item: Any) -> None:
+        """Add `item` at the given integer priority (lower is served first)."""
+        heapq.heappush(self._heap, (self._key(priority), next(self._counter), priority, item))
+
+    def push_many(self, entries: Iterable[Tuple[int, Any]]) -> None:
+        """Add many `(priority, item)` pairs.
+
+        A batch at least as large as the current queue is appended and
+        re-heapified in O(n) instead of paying O(log n) per push.
+        """
+        key = self._key
+        counter = self._counter
+        batch = [(key(priority), next(counter), priority, item) for priority, item in entries]
+        heap = self._heap
+        if len(batch) >= len(heap):
+            heap.extend(batch)
+            heapq.heapify(heap)
+        else:
+            for entry in batch:
+                heapq.heappush(heap, entry)
+
+    def pop(self) -> Tuple[int, Any]:
+        """Remove and return the next `(priority, item)`.
+
+        Raises IndexError if the queue is empty.
+        """
+        if not self._heap:
+            raise IndexError("pop from empty priority queue")
+        key, _, priority, item = heapq.heappop(self._heap)
+        if self._weights is not None:
+            self._virtual_time = key
+        return priority, item
+
+    def pop_many(self, count: int) -> List[Tuple[int, Any]]:
+        """Remove and return up to `count` entries in service order."""
+        heap = self._heap
+        heappop = heapq.heappop
+        taken = [heappop(heap) for _ in range(min(count, len(heap)))]
+        if taken and self._weights is not None:
+            self._virtual_time = taken[-1][0]
+        return [(priority, item) for _, _, priority, item in taken]
+
+    def peek(self) -> Tuple[int, Any]:
+        """Return the next `(priority, item)` without removing it."""
+        if not self._heap:
+            raise IndexError("peek from empty priority queue")
+        _, _, priority, item = self._heap[0]
+        return priority, item
+
+    def is_empty(self) -> bool:
+        return not self._heap
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __iter__(self) -> Iterator[Tuple[int, Any]]:
+        """Yield `(priority, item)` in service order without removing them."""
+        for _, _, priority, item in sorted(self._heap):
+            yield priority, item
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+
+# Category names accepted by `PriorityQueue`, mapped to heap priorities.
+CATEGORY_PRIORITIES: Dict[str, int] = {"faculty": 0, "student": 1}
+_CATEGORY_NAMES = {priority: name for name, priority in CATEGORY_PRIORITIES.items()}
+
+
 class PriorityQueue:
     """Priority queue with two levels: faculty > student.
 
-    Internally maintains two FIFO queues; items are tuples
-    `(category, request)` where category is one of the strings
-    `'faculty'` or `'student'`.  Dequeue always returns the oldest
-    faculty request if any exist, otherwise falls back to student.
+    Items are tuples `(category, request)` where category is one of the
+    strings `'faculty'` or `'student'`.  Categories map to priorities of an
+    internal `HeapPriorityQueue` through `CATEGORY_PRIORITIES` with a single
+    dict lookup.  Every public method speaks in category names.
+    Dequeue returns the oldest faculty request if any exist, otherwise
+    falls back to student.  Pass `weights` keyed by category (e.g.
+    ``{"faculty": 3, "student": 1}``) to serve students a fair share.
     """
 
-    def __init__(self) -> None:
-        self._faculty: Deque[Any] = deque()
-        self._student: Deque[Any] = deque()
+    def __init__(self, weights: Optional[Dict[str, float]] = None) -> None:
+        if weights is not None:
+            weights = {self._priority(name): share for name, share in weights.items()}
+        self._heap = HeapPriorityQueue(weights)
+
+    @staticmethod
+    def _priority(category: str) -> int:
+        priority = CATEGORY_PRIORITIES.get(category)
+        if priority is None:
+            # only pay for case folding when the exact name misses
+            priority = CATEGORY_PRIORITIES.get(category.lower())
+            if priority is None:
+                raise ValueError("Category must be 'faculty' or 'student'")
+        return priority
 
     def enqueue(self, category: str, request: Any) -> None:
         """Add a request under the given category.
 
         Category must be either 'faculty' or 'student'.
         """
-        cat = category.lower()
-        if cat == "faculty":
-            self._faculty.append(request)
-        elif cat == "student":
-            self._student.append(request)
-        else:
-            raise ValueError("Category must be 'faculty' or 'student'")
+        self._heap.push(self._priority(category), request)
+
+    def enqueue_many(self, entries: Iterable[Tuple[str, Any]]) -> None:
+        """Add many `(category, request)` pairs in one batch."""
+        priority = self._priority
+        self._heap.push_many((priority(category), request) for category, request in entries)
 
     def dequeue(self) -> Tuple[str, Any]:
         """Remove and return the highest priority request.
@@ -71,20 +223,298 @@ class PriorityQueue:
         Returns a tuple `(category, request)`.  Raises IndexError if no
         requests remain.
         """
-        if self._faculty:
-            return ("faculty", self._faculty.popleft())
-        if self._student:
-            return ("student", self._student.popleft())
-        raise IndexError("dequeue from empty priority queue")
+        if self._heap.is_empty():
+            raise IndexError("dequeue from empty priority queue")
+        priority, request = self._heap.pop()
+        return _CATEGORY_NAMES[priority], request
+
+    def dequeue_many(self, count: int) -> List[Tuple[str, Any]]:
+        """Remove and return up to `count` `(category, request)` pairs in service order."""
+        return [(_CATEGORY_NAMES[priority], request) for priority, request in self._heap.pop_many(count)]
+
+    def peek(self) -> Tuple[str, Any]:
+        """Return the next `(category, request)` without removing it."""
+        priority, request = self._heap.peek()
+        return _CATEGORY_NAMES[priority], request
+
+    def is_empty(self) -> bool:
+        return self._heap.is_empty()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        """Yield `(category, request)` in service order without removing them."""
+        for priority, request in self._heap:
+            yield _CATEGORY_NAMES[priority], request
+
+    def __repr__(self) -> str:
+        lanes: Dict[str, List[Any]] = {name: [] for name in CATEGORY_PRIORITIES}
+        for category, request in self:
+            lanes[category].append(request)
+        return f"PriorityQueue(faculty={lanes['faculty']!r}, student={lanes['student']!r})"
+
+
+class IndexedPriorityQueue:
+    """Binary heap keyed by request id with decrease-key and cancel.
+
+    Entries are `[priority, seq, request_id, item]` lists, ordered by
+    priority (lower first) and then by arrival.  `_position` maps every
+    request id to its current heap index and is updated on each swap.
+    That lets `update_priority` and `cancel` find a request in O(1) and
+    repair the heap in O(log n).  A request keeps its arrival number
+    when escalated, so it still queues behind earlier requests at the
+    new level.
+    """
+
+    def __init__(self) -> None:
+        self._heap: List[List[Any]] = []
+        self._position: Dict[Any, int] = {}
+        self._counter = itertools.count()
+
+    @staticmethod
+    def _before(a: List[Any], b: List[Any]) -> bool:
+        return a[0] < b[0] or (a[0] == b[0] and a[1] < b[1])
+
+    def _place(self, index: int, entry: List[Any]) -> None:
+        self._heap[index] = entry
+        self._position[entry[2]] = index
+
+    def _sift_up(self, index: int) -> None:
+        heap = self._heap
+        entry = heap[index]
+        while index > 0:
+            parent = (index - 1) >> 1
+            if not self._before(entry, heap[parent]):
+                break
+            self._place(index, heap[parent])
+            index = parent
+        self._place(index, entry)
+
+    def _sift_down(self, index: int) -> None:
+        heap = self._heap
+        size = len(heap)
+        entry = heap[index]
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            right = child + 1
+            if right < size and self._before(heap[right], heap[child]):
+                child = right
+            if not self._before(heap[child], entry):
+                break
+            self._place(index, heap[child])
+            index = child
+        self._place(index, entry)
+
+    def push(self, request_id: Any, priority: int, item: Any = None) -> None:
+        """Queue `item` under a unique `request_id` at `priority`."""
+        if request_id in self._position:
+            raise ValueError(f"request {request_id!r} is already queued")
+        self._heap.append([priority, next(self._counter), request_id, item])
+        self._sift_up(len(self._heap) - 1)
+
+    def _remove_at(self, index: int) -> List[Any]:
+        heap = self._heap
+        entry = heap[index]
+        last = heap.pop()
+        del self._position[entry[2]]
+        if index < len(heap):
+            self._place(index, last)
+            if index > 0 and self._before(last, heap[(index - 1) >> 1]):
+                self._sift_up(index)
+            else:
+                self._sift_down(index)
+        return entry
+
+    def pop(self) -> Tuple[Any, int, Any]:
+        """Remove and return `(request_id, priority, item)` for the next request.
+
+        Raises IndexError if the queue is empty.
+        """
+        if not self._heap:
+            raise IndexError("pop from empty priority queue")
+        priority, _, request_id, item = self._remove_at(0)
+        return request_id, priority, item
+
+    def peek(self) -> Tuple[Any, int, Any]:
+        """Return the next `(request_id, priority, item)` without removing it."""
+        if not self._heap:
+            raise IndexError("peek from empty priority queue")
+        priority, _, request_id, item = self._heap[0]
+        return request_id, priority, item
+
+    def update_priority(self, request_id: Any, priority: int) -> None:
+        """Move a queued request to `priority` in O(log n).
+
+        Raises KeyError if the request is not queued.
+        """
+        index = self._position[request_id]
+        entry = self._heap[index]
+        old = entry[0]
+        entry[0] = priority
+        if priority < old:
+            self._sift_up(index)
+        elif priority > old:
+            self._sift_down(index)
+
+    def cancel(self, request_id: Any) -> Any:
+        """Remove a queued request in O(log n) and return its item.
+
+        Raises KeyError if the request is not queued.
+        """
+        return self._remove_at(self._position[request_id])[3]
+
+    def priority_of(self, request_id: Any) -> int:
+        """Return the current priority of a queued request."""
+        return self._heap[self._position[request_id]][0]
 
     def is_empty(self) -> bool:
-        return not (self._faculty or self._student)
+        return not self._heap
+
+    def __contains__(self, request_id: Any) -> bool:
+        return request_id in self._position
+
+    def __len__(self) -> int:
+        return len(self._heap)
 
     def __repr__(self) -> str:
-        return (
-            f"PriorityQueue(faculty={list(self._faculty)!r}, "
-            f"student={list(self._student)!r})"
-        )
+        ordered = [(rid, priority) for priority, _, rid, _ in sorted(self._heap, key=lambda e: (e[0], e[1]))]
+        return f"IndexedPriorityQueue({ordered!r})"
+
+
+# ------------------------------------------------------------------
+# asyncio variants
+# ------------------------------------------------------------------
+
+class AsyncQueue(BatchingQueueMixin, asyncio.Queue):
+    """asyncio FIFO queue for borrow requests, stored in a `Queue`.
+
+    Built on `asyncio.Queue` by replacing the storage it keeps in
+    `self._queue` through its `_init`/`_put`/`_get` hooks.  Awaiting `put`
+    on a full queue (when `maxsize` > 0) therefore suspends the producer
+    until a consumer makes room, and any number of producer and consumer
+    tasks may share one instance.
+    """
+
+    def _init(self, maxsize: int) -> None:
+        self._queue = Queue()
+
+    def _put(self, item: Any) -> None:
+        self._queue.enqueue(item)
+
+    def _get(self) -> Any:
+        return self._queue.dequeue()
+
+
+class AsyncPriorityQueue(AsyncQueue):
+    """asyncio faculty/student queue backed by `PriorityQueue`.
+
+    Items are `(category, request)` tuples; `get` returns the same shape,
+    faculty first (or weighted-fair when `weights` is given).
+    """
+
+    def __init__(self, maxsize: int = 0, weights: Optional[Dict[str, float]] = None) -> None:
+        self._weights = weights
+        super().__init__(maxsize)
+
+    def _init(self, maxsize: int) -> None:
+        self._queue = PriorityQueue(self._weights)
+
+    def _put(self, item: Tuple[str, Any]) -> None:
+        category, request = item
+        self._queue.enqueue(category, request)
+
+    def _get(self) -> Tuple[str, Any]:
+        return self._queue.dequeue()
+
+
+async def _async_demo() -> None:
+    requests: AsyncPriorityQueue = AsyncPriorityQueue(maxsize=2)
+
+    async def producer(category: str, prefix: str, count: int) -> None:
+        for i in range(1, count + 1):
+            # blocks while two requests are already waiting
+            await requests.put((category, f"{prefix}-{i}"))
+
+    producers = [
+        asyncio.create_task(producer("student", "stud", 3)),
+        asyncio.create_task(producer("faculty", "fac", 3)),
+    ]
+    served = 0
+    while served < 6:
+        batch = await requests.get_batch(max_n=4, timeout=1.0)
+        served += len(batch)
+        print("served batch:", batch)
+    await asyncio.gather(*producers)
+
+
+# ------------------------------------------------------------------
+# Benchmark
+# ------------------------------------------------------------------
+
+def benchmark_priority_queue(n: int = 1_000_000, levels: int = 8) -> None:
+    """Time single and batched push/pop on `n` requests over `levels` priorities."""
+    requests = [(random.randrange(levels), f"req-{i}") for i in range(n)]
+    print(f"\nHeapPriorityQueue with {n:,} requests over {levels} levels (seconds)")
+    print(f"{'Variant':<34}{'Push':>10}{'Pop':>10}")
+
+    for label, weights in (("strict", None), ("weighted-fair", {p: levels - p for p in range(levels)})):
+        queue = HeapPriorityQueue(weights)
+        start = time.perf_counter()
+        for priority, request in requests:
+            queue.push(priority, request)
+        push_s = time.perf_counter() - start
+        start = time.perf_counter()
+        while queue:
+            queue.pop()
+        pop_s = time.perf_counter() - start
+        print(f"{label + ' push/pop':<34}{push_s:>10.3f}{pop_s:>10.3f}")
+
+        queue = HeapPriorityQueue(weights)
+        start = time.perf_counter()
+        queue.push_many(requests)
+        push_s = time.perf_counter() - start
+        start = time.perf_counter()
+        while queue:
+            queue.pop_many(1024)
+        pop_s = time.perf_counter() - start
+        print(f"{label + ' push_many/pop_many':<34}{push_s:>10.3f}{pop_s:>10.3f}")
+    print("\nNote: results vary by system load and Python interpreter.")
+
+
+def benchmark_indexed_updates(n: int = 100_000, changes: int = 1_000) -> None:
+    """Compare in-place escalate/cancel with rebuilding a heap each time."""
+    entries = [(random.randrange(10), i) for i in range(n)]
+    targets = random.sample(range(n), changes)
+
+    queue = IndexedPriorityQueue()
+    for priority, rid in entries:
+        queue.push(rid, priority)
+    start = time.perf_counter()
+    for i, rid in enumerate(targets):
+        if i % 2:
+            queue.cancel(rid)
+        else:
+            queue.update_priority(rid, 0)
+    indexed_s = time.perf_counter() - start
+
+    heap = [(priority, rid, rid) for priority, rid in entries]
+    heapq.heapify(heap)
+    start = time.perf_counter()
+    for i, rid in enumerate(targets):
+        # the old workaround: filter or rewrite the entry, then re-heapify
+        if i % 2:
+            heap = [entry for entry in heap if entry[2] != rid]
+        else:
+            heap = [(0, seq, r) if r == rid else (p, seq, r) for p, seq, r in heap]
+        heapq.heapify(heap)
+    rebuild_s = time.perf_counter() - start
+
+    print(f"\n{changes:,} escalations/cancellations on {n:,} queued requests (seconds)")
+    print(f"{'IndexedPriorityQueue':<28}{indexed_s:>10.4f}")
+    print(f"{'Rebuild + heapify':<28}{rebuild_s:>10.4f}")
 
 
 # ------------------------------------------------------------------
@@ -92,6 +522,11 @@ class PriorityQueue:
 # ------------------------------------------------------------------
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--benchmark":
+        benchmark_priority_queue()
+        benchmark_indexed_updates()
+        sys.exit(0)
+
     # FIFO queue example
     print("=== FIFO queue demo ===")
     q = Queue()
@@ -113,3 +548,25 @@ if __name__ == "__main__":
     while not pq.is_empty():
         cat, req = pq.dequeue()
         print(f"dequeue {cat}: {req}")
+
+    # Weighted-fair mode: faculty get 3 of every 4 slots while both wait
+    print("\n=== Weighted-fair priority queue demo ===")
+    fair = PriorityQueue(weights={"faculty": 3, "student": 1})
+    for i in range(1, 7):
+        fair.enqueue("faculty", f"fac-{i}")
+        fair.enqueue("student", f"stud-{i}")
+    print("service order:", [req for _, req in fair.dequeue_many(len(fair))])
+
+    # Indexed queue: escalate and cancel requests in place
+    print("\n=== Indexed priority queue demo ===")
+    ipq = IndexedPriorityQueue()
+    for rid, priority in [("B-101", 2), ("B-102", 1), ("B-103", 2), ("B-104", 3)]:
+        ipq.push(rid, priority, f"book for {rid}")
+    ipq.update_priority("B-104", 0)  # escalated by the librarian
+    print("cancelled:", ipq.cancel("B-103"))
+    while not ipq.is_empty():
+        print("dequeue", ipq.pop())
+
+    # asyncio queue shared by two producers, drained in batches
+    print("\n=== Async priority queue demo ===")
+    asyncio.run(_async_demo())
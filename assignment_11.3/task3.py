@@ -5,9 +5,30 @@ Tickets arrive sequentially but are escalated in LIFO order.  This
 module implements a simple stack with the required operations and
 simulates handling five tickets.  Additional utility methods include
 checks for emptiness and a (configurable) maximum size.
+
+`ArrayTicketStack` is a bounded stack over a preallocated slot array.
+Its `snapshot()` gives dashboards an O(1) copy-on-write view.
+
+`ConcurrentTicketStack` is safe to share between agent threads.  When
+its lock is contended, a push and a pop can meet in an elimination
+array and hand the ticket over directly.
+
+`DurableTicketStack` survives restarts by recording every push and pop
+in an append-only write-ahead log.  It fsyncs in groups, replays the log
+on startup and compacts it periodically.  Run with ``--benchmark`` to
+compare its throughput with the in-memory stack and to measure the
+concurrent stack under 2-32 threads.
 """
 
 from __future__ import annotations
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import weakref
 from typing import Any, List, Optional
 
 
@@ -55,11 +76,538 @@ class TicketStack:
         return f"TicketStack({self._stack!r}, max_size={self._max_size!r})"
 
 
+class StackSnapshot:
+    """Read-only view of an ArrayTicketStack at the moment it was taken."""
+
+    __slots__ = ("_slots", "_top")
+
+    def __init__(self, slots: List[Any], top: int) -> None:
+        self._slots = slots
+        self._top = top
+
+    def peek(self) -> Any:
+        if not self._top:
+            raise IndexError("peek from empty snapshot")
+        return self._slots[self._top - 1]
+
+    def to_list(self) -> List[Any]:
+        """Tickets from bottom to top, like TicketStack's repr."""
+        return self._slots[:self._top]
+
+    def __len__(self) -> int:
+        return self._top
+
+    def __iter__(self):
+        """Iterate from the top of the stack down."""
+        for i in range(self._top - 1, -1, -1):
+            yield self._slots[i]
+
+    def __repr__(self) -> str:
+        return f"StackSnapshot({self.to_list()!r})"
+
+
+class ArrayTicketStack(TicketStack):
+    """Bounded TicketStack over `max_size` preallocated slots.
+
+    Push and pop only write one slot and move the top index, so the
+    backing list never reallocates.  `snapshot()` shares the slot array
+    with the returned view instead of copying it.  The first later write
+    that could change what the view sees copies the array once.  Pops
+    only move the top index while a view is outstanding, so they never
+    trigger a copy.
+
+    The slot array replaces TicketStack's `_stack` list entirely, so the
+    base initialiser is not called and every operation is overridden.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        if max_size is None or max_size <= 0:
+            raise ValueError("ArrayTicketStack needs a positive max_size")
+        self._max_size = max_size
+        self._slots: List[Any] = [None] * max_size
+        self._top = 0
+        # Top index of the newest outstanding snapshot; -1 when the array is private.
+        self._shared_top = -1
+
+    def to_list(self) -> List[Any]:
+        """Tickets from bottom to top (a copy)."""
+        return self._slots[:self._top]
+
+    def push(self, ticket: Any) -> None:
+        """Add a ticket to the top of the stack.
+
+        Raises OverflowError if the stack is full.
+        """
+        top = self._top
+        if top >= self._max_size:
+            raise OverflowError("Stack is full")
+        if top < self._shared_top:
+            self._unshare()
+        self._slots[top] = ticket
+        self._top = top + 1
+
+    def pop(self) -> Any:
+        """Remove and return the ticket at the top of the stack.
+
+        Raises IndexError if the stack is empty.
+        """
+        if not self._top:
+            raise IndexError("pop from empty list")
+        self._top -= 1
+        ticket = self._slots[self._top]
+        if self._shared_top < 0:
+            self._slots[self._top] = None  # drop the reference
+        return ticket
+
+    def _unshare(self) -> None:
+        self._slots = self._slots[:self._top] + [None] * (self._max_size - self._top)
+        self._shared_top = -1
+
+    def snapshot(self) -> StackSnapshot:
+        """Return an O(1) read-only view of the current tickets."""
+        self._shared_top = max(self._shared_top, self._top)
+        return StackSnapshot(self._slots, self._top)
+
+    def peek(self) -> Any:
+        if not self._top:
+            raise IndexError("peek from empty stack")
+        return self._slots[self._top - 1]
+
+    def is_empty(self) -> bool:
+        return not self._top
+
+    def is_full(self) -> bool:
+        return self._top >= self._max_size
+
+    def __len__(self) -> int:
+        return self._top
+
+    def __repr__(self) -> str:
+        return f"ArrayTicketStack({self.to_list()!r}, max_size={self._max_size!r})"
+
+
+class DurableTicketStack(TicketStack):
+    """TicketStack whose pushes and pops are written to a log file.
+
+    Each change appends one line to the log at `path`: ``+<json>`` for
+    a push and ``-`` for a pop.  Opening an existing log replays it to
+    rebuild the stack.  A torn final line left by a crash is ignored and
+    truncated away.
+
+    Every change is handed to the operating system before push/pop
+    returns, so a crash of the process itself loses nothing.  fsync is
+    group-committed.  It runs once `sync_every` changes have accumulated,
+    and a background flusher also syncs any pending changes at most
+    `sync_interval` seconds after they were written.  An OS crash or power
+    loss can therefore lose at most the changes from that window.  Call
+    `sync()` (or `close()`) for a hard durability point.  ``sync_every=1``
+    makes every change durable before it returns.  ``sync_interval=None``
+    disables the flusher.  The flusher thread holds only a weak reference
+    to the stack, so a stack dropped without `close()` is still collected
+    and its flusher stops.  Prefer ``with DurableTicketStack(...)`` or an
+    explicit `close()`, which also make the final fsync.
+
+    Compaction: when the log holds more than `compact_every` lines and
+    more than twice as many lines as live tickets, it is rewritten as one
+    push per live ticket.  The new log is written to a temporary file,
+    fsynced and atomically renamed over the old one.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_size: Optional[int] = None,
+        sync_every: int = 64,
+        sync_interval: float = 0.05,
+        compact_every: int = 10_000,
+    ) -> None:
+        if sync_every <= 0:
+            raise ValueError("sync_every must be positive")
+        super().__init__(max_size)
+        self._path = path
+        self._sync_every = sync_every
+        self._sync_interval = sync_interval
+        self._compact_every = compact_every
+        self._log_records = self._replay()
+        self._log = open(path, "a", encoding="utf-8")
+        self._pending = 0
+        # Guards the log file between callers and the background flusher.
+        self._log_lock = threading.RLock()
+        self._closing = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        if sync_interval is not None:
+            self._flusher = threading.Thread(
+                target=DurableTicketStack._flush_periodically,
+                args=(weakref.ref(self), self._closing, sync_interval),
+                daemon=True,
+            )
+            self._flusher.start()
+            weakref.finalize(self, self._closing.set)
+
+    def _replay(self) -> int:
+        """Rebuild the stack from the log; return the number of records."""
+        if not os.path.exists(self._path):
+            return 0
+        records = 0
+        good_bytes = 0
+        stack = self._stack
+        with open(self._path, "rb") as log:
+            for raw in log:
+                if not raw.endswith(b"\n"):
+                    break  # torn write from a crash
+                if raw[:1] == b"+":
+                    try:
+                        stack.append(json.loads(raw[1:]))
+                    except ValueError:
+                        break
+                elif raw[:1] == b"-" and stack:
+                    stack.pop()
+                else:
+                    break
+                records += 1
+                good_bytes += len(raw)
+        if good_bytes != os.path.getsize(self._path):
+            with open(self._path, "r+b") as log:
+                log.truncate(good_bytes)
+        return records
+
+    @staticmethod
+    def _flush_periodically(stack_ref: "weakref.ref[DurableTicketStack]", closing: threading.Event,
+                            interval: float) -> None:
+        """Background flusher: fsync pending changes every `interval` seconds.
+
+        The stack is only dereferenced for each round, so this thread never
+        keeps it alive.
+        """
+        while not closing.wait(interval):
+            stack = stack_ref()
+            if stack is None:
+                return
+            with stack._log_lock:
+                if stack._pending and not stack._log.closed:
+                    stack.sync()
+            del stack
+
+    def _append(self, line: str) -> None:
+        with self._log_lock:
+            self._log.write(line)
+            self._log.flush()
+            self._log_records += 1
+            self._pending += 1
+            if self._pending >= self._sync_every:
+                self.sync()
+            if self._log_records > self._compact_every and self._log_records > 2 * len(self._stack):
+                self.compact()
+
+    def push(self, ticket: Any) -> None:
+        """Add a ticket and log it.
+
+        Raises OverflowError if the stack is full (when max_size is set).
+        """
+        line = "+" + json.dumps(ticket, separators=(",", ":")) + "\n"
+        super().push(ticket)
+        self._append(line)
+
+    def pop(self) -> Any:
+        """Remove the top ticket and log the pop.
+
+        Raises IndexError if the stack is empty.
+        """
+        ticket = super().pop()
+        self._append("-\n")
+        return ticket
+
+    def sync(self) -> None:
+        """Flush buffered log lines and fsync them to disk."""
+        with self._log_lock:
+            self._log.flush()
+            os.fsync(self._log.fileno())
+            self._pending = 0
+
+    def compact(self) -> None:
+        """Rewrite the log as one push per live ticket."""
+        with self._log_lock:
+            self._compact()
+
+    def _compact(self) -> None:
+        self.sync()
+        directory = os.path.dirname(os.path.abspath(self._path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tickets-", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as tmp:
+            for ticket in self._stack:
+                tmp.write("+" + json.dumps(ticket, separators=(",", ":")) + "\n")
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        self._log.close()
+        os.replace(tmp_path, self._path)
+        if hasattr(os, "O_DIRECTORY"):
+            dir_fd = os.open(directory, os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        self._log = open(self._path, "a", encoding="utf-8")
+        self._log_records = len(self._stack)
+
+    def close(self) -> None:
+        """Stop the flusher, then sync and close the log."""
+        self._closing.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        with self._log_lock:
+            if not self._log.closed:
+                self.sync()
+                self._log.close()
+
+    def __enter__(self) -> "DurableTicketStack":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"DurableTicketStack({self._stack!r}, max_size={self._max_size!r}, "
+            f"path={self._path!r})"
+        )
+
+
+_SLOT_EMPTY, _SLOT_OFFERED, _SLOT_TAKEN = 0, 1, 2
+
+
+class _EliminationSlot:
+    """Meeting point where one pusher hands a ticket to one popper."""
+
+    __slots__ = ("cond", "state", "ticket")
+
+    def __init__(self) -> None:
+        self.cond = threading.Condition(threading.Lock())
+        self.state = _SLOT_EMPTY
+        self.ticket: Any = None
+
+
+class ConcurrentTicketStack(TicketStack):
+    """Thread-safe TicketStack with an elimination-backoff array.
+
+    Operations first try the stack lock without blocking.  If another
+    agent holds it, the thread backs off to a random elimination slot.
+    A pusher leaves its ticket there for up to `backoff` seconds.  A
+    popper that finds a waiting ticket takes it directly.  The
+    pair cancels out without touching the shared list.  Unmatched threads
+    fall back to a blocking acquire.
+
+    An eliminated push/pop pair behaves as a push immediately followed by
+    a pop, so LIFO order is preserved.  Pushers only offer while the stack
+    is below `max_size`.  A push against a full stack therefore still
+    raises OverflowError, and a pop against an empty stack still raises
+    IndexError.
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        elimination_slots: int = 4,
+        backoff: float = 0.0005,
+    ) -> None:
+        super().__init__(max_size)
+        self._lock = threading.Lock()
+        self._slots = [_EliminationSlot() for _ in range(elimination_slots)]
+        self._backoff = backoff
+        self.eliminated = 0
+
+    def push(self, ticket: Any) -> None:
+        """Add a ticket to the top of the stack.
+
+        Raises OverflowError if the stack is full (when max_size is set).
+        """
+        if not self._lock.acquire(blocking=False):
+            if self._slots and not self.is_full() and self._offer(ticket):
+                return
+            self._lock.acquire()
+        try:
+            super().push(ticket)
+        finally:
+            self._lock.release()
+
+    def pop(self) -> Any:
+        """Remove and return the ticket at the top of the stack.
+
+        Raises IndexError if the stack is empty.
+        """
+        if not self._lock.acquire(blocking=False):
+            if self._slots:
+                slot = random.choice(self._slots)
+                with slot.cond:
+                    if slot.state == _SLOT_OFFERED:
+                        slot.state = _SLOT_TAKEN
+                        ticket, slot.ticket = slot.ticket, None
+                        slot.cond.notify()
+                        return ticket
+            self._lock.acquire()
+        try:
+            return super().pop()
+        finally:
+            self._lock.release()
+
+    def _offer(self, ticket: Any) -> bool:
+        """Park `ticket` in a free slot; return True if a popper took it."""
+        slot = random.choice(self._slots)
+        with slot.cond:
+            if slot.state != _SLOT_EMPTY:
+                return False
+            slot.state = _SLOT_OFFERED
+            slot.ticket = ticket
+            slot.cond.wait(self._backoff)
+            taken = slot.state == _SLOT_TAKEN
+            slot.state = _SLOT_EMPTY
+            slot.ticket = None
+            if taken:
+                self.eliminated += 1
+            return taken
+
+    def peek(self) -> Any:
+        with self._lock:
+            return super().peek()
+
+    def is_empty(self) -> bool:
+        with self._lock:
+            return super().is_empty()
+
+    def is_full(self) -> bool:
+        # A single len() read is atomic; no lock needed for a hint.
+        return super().is_full()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return super().__len__()
+
+    def __repr__(self) -> str:
+        with self._lock:
+            return f"ConcurrentTicketStack({self._stack!r}, max_size={self._max_size!r})"
+
+
+class _GlobalLockTicketStack(TicketStack):
+    """Baseline for the contention benchmark: every call takes one lock."""
+
+    def __init__(self, max_size: Optional[int] = None) -> None:
+        super().__init__(max_size)
+        self._lock = threading.Lock()
+
+    def push(self, ticket: Any) -> None:
+        with self._lock:
+            super().push(ticket)
+
+    def pop(self) -> Any:
+        with self._lock:
+            return super().pop()
+
+
+# ------------------------------------------------------------------
+# Benchmark
+# ------------------------------------------------------------------
+
+def benchmark_durability(n: int = 50_000) -> None:
+    """Compare push/pop throughput of the in-memory and WAL-backed stacks."""
+    tickets = [{"id": i, "summary": f"printer jam #{i}"} for i in range(n)]
+    print(f"\nTicket stack throughput, {n:,} pushes then {n:,} pops (ops/second)")
+    print(f"{'Stack':<34}{'Push':>12}{'Pop':>12}{'Replay (ms)':>13}")
+
+    def run(label: str, stack: TicketStack) -> None:
+        start = time.perf_counter()
+        for ticket in tickets:
+            stack.push(ticket)
+        push_rate = n / (time.perf_counter() - start)
+        replay = "-"
+        if isinstance(stack, DurableTicketStack):
+            stack.sync()
+            start = time.perf_counter()
+            DurableTicketStack(stack._path, compact_every=2 * n + 1).close()
+            replay = f"{(time.perf_counter() - start) * 1e3:.1f}"
+        start = time.perf_counter()
+        while not stack.is_empty():
+            stack.pop()
+        pop_rate = n / (time.perf_counter() - start)
+        print(f"{label:<34}{push_rate:>12,.0f}{pop_rate:>12,.0f}{replay:>13}")
+
+    run("TicketStack (memory)", TicketStack())
+    with tempfile.TemporaryDirectory() as tmp:
+        for sync_every in (1024, 64):
+            path = os.path.join(tmp, f"tickets-{sync_every}.log")
+            with DurableTicketStack(path, sync_every=sync_every, sync_interval=1.0,
+                                    compact_every=2 * n + 1) as stack:
+                run(f"DurableTicketStack sync_every={sync_every}", stack)
+    print("\nNote: fsync cost depends heavily on the storage device.")
+
+
+def benchmark_bounded(max_size: int = 1_000, rounds: int = 200) -> None:
+    """Fill and drain a bounded stack repeatedly, with periodic snapshots."""
+    print(f"\nBounded stack, max_size={max_size:,}, {rounds} fill/drain rounds")
+    print(f"{'Stack':<22}{'ops/second':>14}{'snapshot (us)':>16}")
+    for cls in (TicketStack, ArrayTicketStack):
+        stack = cls(max_size)
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for i in range(max_size):
+                stack.push(i)
+            while not stack.is_empty():
+                stack.pop()
+        rate = 2 * rounds * max_size / (time.perf_counter() - start)
+        for i in range(max_size):
+            stack.push(i)
+        start = time.perf_counter()
+        take_snapshot = stack.snapshot if cls is ArrayTicketStack else stack._stack.copy
+        for _ in range(1_000):
+            take_snapshot()
+        snap_us = (time.perf_counter() - start) * 1e3
+        print(f"{cls.__name__:<22}{rate:>14,.0f}{snap_us:>16.2f}")
+    print("(TicketStack's snapshot column is a list copy, for comparison.)")
+
+
+def benchmark_contention(ops_per_thread: int = 20_000,
+                         thread_counts=(2, 4, 8, 16, 32)) -> None:
+    """Measure push/pop pairs per second as the number of agent threads grows."""
+    print(f"\nConcurrent push/pop pairs, {ops_per_thread:,} pairs per thread (pairs/second)")
+    print(f"{'Threads':>8}{'Global lock':>14}{'Elimination':>14}{'Eliminated':>12}")
+
+    def run(stack: TicketStack, threads: int) -> float:
+        barrier = threading.Barrier(threads + 1)
+
+        def agent() -> None:
+            barrier.wait()
+            for i in range(ops_per_thread):
+                stack.push(i)
+                stack.pop()
+
+        workers = [threading.Thread(target=agent) for _ in range(threads)]
+        for worker in workers:
+            worker.start()
+        barrier.wait()
+        start = time.perf_counter()
+        for worker in workers:
+            worker.join()
+        return threads * ops_per_thread / (time.perf_counter() - start)
+
+    for threads in thread_counts:
+        baseline = run(_GlobalLockTicketStack(), threads)
+        stack = ConcurrentTicketStack()
+        rate = run(stack, threads)
+        print(f"{threads:>8}{baseline:>14,.0f}{rate:>14,.0f}{stack.eliminated:>12,}")
+    print("\nNote: under CPython's GIL the stack lock is rarely contended, so few")
+    print("operations reach the elimination array; the array pays off on")
+    print("free-threaded builds or when pushes do real work while holding the lock.")
+
+
 # ------------------------------------------------------------------
 # Demonstration of stack behavior
 # ------------------------------------------------------------------
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--benchmark":
+        benchmark_durability()
+        benchmark_bounded()
+        benchmark_contention()
+        sys.exit(0)
+
     stack = TicketStack()
     print("Initial stack (should be empty):", stack)
 
@@ -80,3 +628,23 @@ if __name__ == "__main__":
         print("pop (resolved):", resolved)
 
     print("Final stack (should be empty):", stack)
+
+    # bounded array stack: a snapshot keeps its view while pushes continue
+    bounded = ArrayTicketStack(max_size=5)
+    for i in range(1, 4):
+        bounded.push(f"Ticket {i}")
+    view = bounded.snapshot()
+    bounded.pop()
+    bounded.push("Ticket 9")
+    print("\nArray stack:", bounded)
+    print("Snapshot taken earlier:", view)
+
+    # durable stack: tickets survive closing and reopening the log
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        log_path = os.path.join(tmp_dir, "tickets.log")
+        with DurableTicketStack(log_path, max_size=10) as durable:
+            for i in range(1, 4):
+                durable.push(f"ticket-{i}")
+            durable.pop()
+        with DurableTicketStack(log_path, max_size=10) as durable:
+            print("\nReplayed after restart:", durable)
@@ -2,69 +2,1375 @@
 Simple hash table implementation with chaining for collision resolution.
 
 Provides `insert`, `search`, and `delete` methods.  Keys are assumed to
-be hashable and unique; values can be any object.  The table uses a
-fixed number of buckets and stores entries in linked lists (Python
-`list`s) when collisions occur.
+be hashable and unique; values can be any object.  By default the table
+stores entries in linked lists (Python `list`s) when collisions occur,
+and doubles its number of buckets whenever the load factor (entries per
+bucket) passes `max_load_factor`.
+
+`HashTable` also supports the mapping protocol (`table[key]`, `in`,
+`del`, `len`) and lazy `keys()`/`values()`/`items()` generators.  The
+entry count is tracked on every insert/delete so `len` is O(1), and
+`get(key, default)` reports a miss without raising `KeyError`.
+
+Two optional behaviours can be selected at construction:
+
+- ``mode="open"`` stores entries in flat parallel arrays using open
+  addressing, with either ``probing="linear"`` or ``probing="robin_hood"``.
+- ``incremental=True`` spreads the rehash that follows a resize across
+  later operations instead of moving every entry at once, which removes
+  the latency spike of a single large resize.
+
+Passing ``track_stats=True`` records probes per lookup and resize
+cost; `stats()` returns those counters together with the bucket
+occupancy histogram and chain lengths as a plain dict.  `stress_keys`
+feeds adversarial key sets through every mode to show how lookups
+degrade when the hash spreads keys badly.
+
+`StripedHashTable` is a thread-safe chaining table for sharing across a
+thread pool.  Its buckets are guarded by a fixed set of stripe locks, so
+threads working on keys in different stripes never wait for each other.
+
+`DiskHashTable` keeps its buckets in a memory-mapped file so tables
+larger than RAM survive restarts: `DiskHashTable.open(path)` maps an
+existing file in milliseconds instead of re-inserting every key.
 
 Usage example in `__main__` demonstrates basic operations and collision
-behavior.
+behavior.  Run with ``--benchmark`` to compare the storage modes, or
+``--stress`` to run the adversarial key sets.
 """
 
 from __future__ import annotations
-from typing import Any, List, Tuple
+import hashlib
+import mmap
+import os
+import pickle
+import random
+import struct
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+_MISSING = object()
+# 2**64 / golden ratio: spreads consecutive hashes across open-addressing slots
+_FIB_MULTIPLIER = 0x9E3779B97F4A7C15
+_UINT64_MASK = (1 << 64) - 1
+
+
+# ------------------------------------------------------------------
+# Storage strategies
+# ------------------------------------------------------------------
+
+class _ChainingStore:
+    """Buckets of `(key, value)` lists indexed by `hash(key) % capacity`.
+
+    Bucket lists are created on first insert, so allocating a large table
+    during a resize is a single `[None] * capacity` rather than one list
+    object per bucket.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.buckets: List[Optional[List[Tuple[Any, Any]]]] = [None] * capacity
+        self.size = 0
+        self._drain_cursor = 0
+
+    def index(self, key: Any) -> int:
+        return hash(key) % self.capacity
+
+    def lookup(self, key: Any) -> Any:
+        """Return the value for `key`, or `_MISSING`."""
+        bucket = self.buckets[hash(key) % self.capacity]
+        if bucket:
+            for k, v in bucket:
+                if k == key:
+                    return v
+        return _MISSING
+
+    def put(self, key: Any, value: Any) -> bool:
+        """Insert or update `key`; return True if the key is new."""
+        idx = hash(key) % self.capacity
+        bucket = self.buckets[idx]
+        if bucket is None:
+            bucket = self.buckets[idx] = []
+        for i, (k, _) in enumerate(bucket):
+            if k == key:
+                bucket[i] = (key, value)
+                return False
+        bucket.append((key, value))
+        self.size += 1
+        return True
+
+    def remove(self, key: Any) -> Any:
+        """Remove `key` and return its value, or `_MISSING`."""
+        bucket = self.buckets[hash(key) % self.capacity]
+        if bucket:
+            for i, (k, v) in enumerate(bucket):
+                if k == key:
+                    del bucket[i]
+                    self.size -= 1
+                    return v
+        return _MISSING
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        for bucket in self.buckets:
+            if bucket:
+                yield from bucket
+
+    def drain(self, count: int) -> List[Tuple[Any, Any]]:
+        """Remove and return up to `count` entries, walking buckets in order."""
+        moved: List[Tuple[Any, Any]] = []
+        buckets = self.buckets
+        while len(moved) < count and self._drain_cursor < self.capacity:
+            bucket = buckets[self._drain_cursor]
+            if bucket:
+                moved.append(bucket.pop())
+                self.size -= 1
+            else:
+                self._drain_cursor += 1
+        return moved
+
+    def probes(self, key: Any) -> int:
+        """Number of entries compared when looking up `key`."""
+        bucket = self.buckets[hash(key) % self.capacity]
+        if not bucket:
+            return 0
+        for i, (k, _) in enumerate(bucket, 1):
+            if k == key:
+                return i
+        return len(bucket)
+
+    def chain_lengths(self) -> List[int]:
+        """Length of every bucket, empty ones included."""
+        return [len(bucket) if bucket else 0 for bucket in self.buckets]
+
+    def describe(self) -> str:
+        return f"buckets={[bucket or [] for bucket in self.buckets]!r}"
+
 
+class _OpenAddressingStore:
+    """Open addressing over flat `hashes`/`keys`/`values` arrays.
+
+    The capacity is rounded up to a power of two.  Each key's hash is
+    multiplied by a Fibonacci constant and the top bits select its home
+    slot, so runs of consecutive integers (whose hashes are themselves)
+    do not fill one long cluster.  The mixed hash is what `hashes`
+    stores.  Collisions probe linearly.  With Robin Hood probing
+    an insert takes the slot of any resident that is closer to its home
+    than the new entry, which keeps probe lengths short and lets a miss
+    stop early.  Deletion shifts later entries back instead of leaving
+    tombstones, so lookups never slow down after many deletes.
+    """
+
+    def __init__(self, capacity: int, robin_hood: bool = False) -> None:
+        bits = 1
+        while (1 << bits) < capacity:
+            bits += 1
+        size = 1 << bits
+        self.capacity = size
+        self._mask = size - 1
+        self._shift = 64 - bits
+        self.robin_hood = robin_hood
+        self.hashes: List[Optional[int]] = [None] * size
+        self.keys: List[Any] = [None] * size
+        self.values: List[Any] = [None] * size
+        self.size = 0
+        self._drain_cursor = 0
+
+    def index(self, key: Any) -> int:
+        return self._mix(key) >> self._shift
+
+    @staticmethod
+    def _mix(key: Any) -> int:
+        return (hash(key) * _FIB_MULTIPLIER) & _UINT64_MASK
+
+    def _find(self, key: Any, h: int) -> int:
+        """Return the slot holding `key` (whose mixed hash is `h`), or -1."""
+        mask = self._mask
+        shift = self._shift
+        hashes = self.hashes
+        keys = self.keys
+        robin_hood = self.robin_hood
+        i = h >> shift
+        dist = 0
+        while True:
+            slot_hash = hashes[i]
+            if slot_hash is None:
+                return -1
+            if slot_hash == h and keys[i] == key:
+                return i
+            if robin_hood and ((i - (slot_hash >> shift)) & mask) < dist:
+                # a resident nearer its home means `key` would have been here
+                return -1
+            i = (i + 1) & mask
+            dist += 1
+
+    def lookup(self, key: Any) -> Any:
+        i = self._find(key, self._mix(key))
+        return _MISSING if i < 0 else self.values[i]
+
+    def put(self, key: Any, value: Any) -> bool:
+        mask = self._mask
+        hashes = self.hashes
+        keys = self.keys
+        values = self.values
+        shift = self._shift
+        h = self._mix(key)
+        i = h >> shift
+        dist = 0
+        while True:
+            slot_hash = hashes[i]
+            if slot_hash is None:
+                hashes[i], keys[i], values[i] = h, key, value
+                self.size += 1
+                return True
+            if slot_hash == h and keys[i] == key:
+                values[i] = value
+                return False
+            if self.robin_hood:
+                slot_dist = (i - (slot_hash >> shift)) & mask
+                if slot_dist < dist:
+                    # take the slot and carry the displaced entry onward;
+                    # it is already unique, so equality checks never match
+                    hashes[i], h = h, slot_hash
+                    keys[i], key = key, keys[i]
+                    values[i], value = value, values[i]
+                    dist = slot_dist
+            i = (i + 1) & mask
+            dist += 1
+
+    def _delete_slot(self, i: int) -> None:
+        """Empty slot `i`, shifting back entries whose probe path crossed it."""
+        mask = self._mask
+        hashes = self.hashes
+        keys = self.keys
+        values = self.values
+        shift = self._shift
+        j = i
+        while True:
+            j = (j + 1) & mask
+            slot_hash = hashes[j]
+            if slot_hash is None:
+                break
+            home = slot_hash >> shift
+            if self.robin_hood:
+                if home == j:
+                    break
+            elif (i < j and i < home <= j) or (i > j and (home > i or home <= j)):
+                # home lies between the hole and j, so j is still reachable
+                continue
+            hashes[i], keys[i], values[i] = slot_hash, keys[j], values[j]
+            i = j
+        hashes[i] = keys[i] = values[i] = None
+        self.size -= 1
+
+    def remove(self, key: Any) -> Any:
+        i = self._find(key, self._mix(key))
+        if i < 0:
+            return _MISSING
+        value = self.values[i]
+        self._delete_slot(i)
+        return value
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        hashes = self.hashes
+        for i in range(self.capacity):
+            if hashes[i] is not None:
+                yield self.keys[i], self.values[i]
+
+    def drain(self, count: int) -> List[Tuple[Any, Any]]:
+        moved: List[Tuple[Any, Any]] = []
+        while len(moved) < count and self._drain_cursor < self.capacity:
+            i = self._drain_cursor
+            if self.hashes[i] is None:
+                self._drain_cursor += 1
+                continue
+            # deleting may shift a later entry into slot i; revisit it
+            moved.append((self.keys[i], self.values[i]))
+            self._delete_slot(i)
+        return moved
+
+    def probes(self, key: Any) -> int:
+        """Number of slots examined when looking up `key`."""
+        mask = self._mask
+        shift = self._shift
+        hashes = self.hashes
+        h = self._mix(key)
+        i = h >> shift
+        dist = 0
+        while True:
+            slot_hash = hashes[i]
+            if slot_hash is None or (slot_hash == h and self.keys[i] == key):
+                return dist + 1
+            if self.robin_hood and ((i - (slot_hash >> shift)) & mask) < dist:
+                return dist + 1
+            i = (i + 1) & mask
+            dist += 1
+
+    def chain_lengths(self) -> List[int]:
+        """Probe length (displacement + 1) of every stored entry."""
+        mask = self._mask
+        shift = self._shift
+        return [
+            ((i - (h >> shift)) & mask) + 1
+            for i, h in enumerate(self.hashes)
+            if h is not None
+        ]
+
+    def describe(self) -> str:
+        slots = [
+            None if h is None else (k, v)
+            for h, k, v in zip(self.hashes, self.keys, self.values)
+        ]
+        return f"slots={slots!r}"
+
+
+# ------------------------------------------------------------------
+# Instrumentation
+# ------------------------------------------------------------------
+
+class _TableStats:
+    """Counters kept only while a table is created with `track_stats`."""
+
+    __slots__ = ("lookups", "probes", "max_probes", "resizes", "resize_seconds")
+
+    def __init__(self) -> None:
+        self.lookups = 0
+        self.probes = 0
+        self.max_probes = 0
+        self.resizes = 0
+        self.resize_seconds = 0.0
+
+    def record_lookup(self, probes: int) -> None:
+        self.lookups += 1
+        self.probes += probes
+        if probes > self.max_probes:
+            self.max_probes = probes
+
+
+# ------------------------------------------------------------------
+# Public hash table
+# ------------------------------------------------------------------
 
 class HashTable:
-    """Basic hash table with chaining collision handling."""
+    """Hash table with chaining or open addressing and automatic resizing."""
 
-    def __init__(self, capacity: int = 8) -> None:
-        """Initialize table with given number of buckets."""
+    def __init__(
+        self,
+        capacity: int = 8,
+        *,
+        mode: str = "chaining",
+        probing: str = "linear",
+        max_load_factor: Optional[float] = 0.75,
+        incremental: bool = False,
+        migrate_step: int = 4,
+        track_stats: bool = False,
+    ) -> None:
+        """Initialize table with given number of buckets.
+
+        `mode` is ``"chaining"`` or ``"open"``; `probing` (``"linear"`` or
+        ``"robin_hood"``) applies to open addressing only.  The table
+        doubles when entries exceed `max_load_factor * capacity`; chaining
+        tables may pass None to keep a fixed capacity.  With `incremental`
+        set, each later operation moves `migrate_step` entries from the
+        old storage instead of rehashing everything during one insert.
+        `track_stats` turns on the lookup and resize counters reported
+        by `stats()`; when off, the hot paths skip them entirely.
+        """
         if capacity <= 0:
             raise ValueError("Capacity must be positive")
-        self._buckets: List[List[Tuple[Any, Any]]] = [[] for _ in range(capacity)]
-        self._capacity = capacity
+        if mode not in ("chaining", "open"):
+            raise ValueError("mode must be 'chaining' or 'open'")
+        if probing not in ("linear", "robin_hood"):
+            raise ValueError("probing must be 'linear' or 'robin_hood'")
+        if max_load_factor is None:
+            if mode == "open":
+                raise ValueError("Open addressing requires a max_load_factor")
+        elif not (0 < max_load_factor < 1 if mode == "open" else 0 < max_load_factor):
+            raise ValueError("max_load_factor out of range for this mode")
+        if migrate_step <= 0:
+            raise ValueError("migrate_step must be positive")
+        self._mode = mode
+        self._probing = probing
+        self._max_load_factor = max_load_factor
+        self._incremental = incremental
+        self._migrate_step = migrate_step
+        self._store = self._new_store(capacity)
+        # storage still being drained by an incremental resize
+        self._old: Optional[Any] = None
+        # bumped whenever a key is added or removed; iterators check it
+        self._version = 0
+        self._stats: Optional[_TableStats] = _TableStats() if track_stats else None
+
+    def _new_store(self, capacity: int):
+        if self._mode == "chaining":
+            return _ChainingStore(capacity)
+        return _OpenAddressingStore(capacity, robin_hood=self._probing == "robin_hood")
+
+    @property
+    def _capacity(self) -> int:
+        return self._store.capacity
+
+    @property
+    def load_factor(self) -> float:
+        """Current number of entries per bucket/slot."""
+        return self._count() / self._store.capacity
+
+    def _count(self) -> int:
+        if self._old is None:
+            return self._store.size
+        return self._store.size + self._old.size
 
     def _bucket_index(self, key: Any) -> int:
         """Compute the index of the bucket for a given key."""
-        return hash(key) % self._capacity
+        return self._store.index(key)
+
+    # -- resizing ------------------------------------------------------
+
+    def _migrate(self, count: int) -> None:
+        """Move up to `count` entries from the old storage into the new one."""
+        old = self._old
+        put = self._store.put
+        start = time.perf_counter() if self._stats is not None else 0.0
+        for key, value in old.drain(count):
+            put(key, value)
+        if old.size == 0:
+            self._old = None
+        if self._stats is not None:
+            self._stats.resize_seconds += time.perf_counter() - start
+
+    def _resize(self, capacity: int) -> None:
+        if self._old is not None:
+            self._migrate(self._old.size)
+        start = time.perf_counter()
+        old, self._store = self._store, self._new_store(capacity)
+        if self._incremental:
+            self._old = old
+        else:
+            put = self._store.put
+            for key, value in old.items():
+                put(key, value)
+        if self._stats is not None:
+            self._stats.resizes += 1
+            self._stats.resize_seconds += time.perf_counter() - start
+
+    def _maybe_grow(self) -> None:
+        count = self._count()
+        capacity = self._store.capacity
+        limit = self._max_load_factor
+        # Open addressing needs an empty slot to end every probe, and an
+        # incremental resize keeps probing the old store until it is drained,
+        # so grow before the store can fill whatever the load factor allows.
+        if (limit is not None and count > limit * capacity) or (
+            self._mode == "open" and count + 1 >= capacity
+        ):
+            self._resize(capacity * 2)
+
+    # -- public operations --------------------------------------------
 
     def insert(self, key: Any, value: Any) -> None:
         """Insert or update a key-value pair in the table.
 
         If the key already exists, its value is replaced.  Otherwise the
-        pair is appended to the appropriate bucket list.
+        pair is added and the table grows if it is now over-loaded.
         """
-        idx = self._bucket_index(key)
-        bucket = self._buckets[idx]
-        for i, (k, _) in enumerate(bucket):
-            if k == key:
-                bucket[i] = (key, value)
-                return
-        bucket.append((key, value))
+        existed = False
+        if self._old is not None:
+            self._migrate(self._migrate_step)
+            if self._old is not None and self._old.remove(key) is not _MISSING:
+                existed = True
+                if self._old.size == 0:
+                    self._old = None
+        if self._store.put(key, value) and not existed:
+            self._version += 1
+            self._maybe_grow()
+
+    def _lookup(self, key: Any) -> Any:
+        """Return the value for `key`, or `_MISSING`, without raising."""
+        if self._old is not None:
+            self._migrate(self._migrate_step)
+        value = self._store.lookup(key)
+        if value is _MISSING and self._old is not None:
+            value = self._old.lookup(key)
+        if self._stats is not None:
+            probes = self._store.probes(key)
+            if self._old is not None and self._store.lookup(key) is _MISSING:
+                probes += self._old.probes(key)
+            self._stats.record_lookup(probes)
+        return value
 
     def search(self, key: Any) -> Any:
         """Return the value associated with `key`, or raise KeyError."""
-        idx = self._bucket_index(key)
-        for k, v in self._buckets[idx]:
-            if k == key:
-                return v
-        raise KeyError(key)
+        value = self._lookup(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the value for `key`, or `default` if it is absent.
+
+        Misses are detected with a sentinel rather than a caught
+        `KeyError`, so this is the cheap path for keys that may be absent.
+        """
+        value = self._lookup(key)
+        return default if value is _MISSING else value
 
     def delete(self, key: Any) -> None:
         """Remove the key-value pair with the given key.
 
         Raises KeyError if the key is not found.
         """
-        idx = self._bucket_index(key)
-        bucket = self._buckets[idx]
-        for i, (k, _) in enumerate(bucket):
-            if k == key:
-                del bucket[i]
-                return
+        if self._old is not None:
+            self._migrate(self._migrate_step)
+        if self._store.remove(key) is not _MISSING:
+            self._version += 1
+            return
+        if self._old is not None and self._old.remove(key) is not _MISSING:
+            self._version += 1
+            if self._old.size == 0:
+                self._old = None
+            return
+        raise KeyError(key)
+
+    # -- mapping protocol ---------------------------------------------
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.search(key)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.insert(key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        self.delete(key)
+
+    def __contains__(self, key: Any) -> bool:
+        return self._lookup(key) is not _MISSING
+
+    def __len__(self) -> int:
+        return self._count()
+
+    def _entries(self) -> Iterator[Tuple[Any, Any]]:
+        """Yield `(key, value)` pairs straight from the live storage.
+
+        Nothing is copied.  Any pending incremental migration is finished
+        first so each entry lives in exactly one place.  Adding or removing
+        a key while the generator is running raises RuntimeError, so every
+        pair it yields belongs to the same version of the table; updating
+        the value of an existing key is allowed.
+        """
+        if self._old is not None:
+            self._migrate(self._old.size)
+        version = self._version
+        for entry in self._store.items():
+            if self._version != version:
+                raise RuntimeError("HashTable changed size during iteration")
+            yield entry
+        if self._version != version:
+            raise RuntimeError("HashTable changed size during iteration")
+
+    def keys(self) -> Iterator[Any]:
+        """Lazily yield every key."""
+        for key, _ in self._entries():
+            yield key
+
+    def values(self) -> Iterator[Any]:
+        """Lazily yield every value."""
+        for _, value in self._entries():
+            yield value
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        """Lazily yield every `(key, value)` pair."""
+        return self._entries()
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.keys()
+
+    # -- instrumentation ------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of the table's shape and counters as a dict.
+
+        The shape (occupancy histogram and chain lengths) is computed from
+        the current storage on each call.  For chaining, the histogram maps
+        a bucket length to how many buckets have it; for open addressing it
+        maps a probe length to how many entries need that many probes.
+        Lookup and resize counters are included only when the table was
+        created with ``track_stats=True``.
+        """
+        lengths = self._store.chain_lengths()
+        if self._old is not None:
+            lengths += self._old.chain_lengths()
+        used = [n for n in lengths if n]
+        result: Dict[str, Any] = {
+            "mode": self._mode if self._mode == "chaining" else f"open/{self._probing}",
+            "capacity": self._store.capacity,
+            "size": self._count(),
+            "load_factor": self.load_factor,
+            "occupancy_histogram": dict(sorted(Counter(lengths).items())),
+            "max_chain_length": max(used, default=0),
+            "mean_chain_length": sum(used) / len(used) if used else 0.0,
+        }
+        stats = self._stats
+        if stats is not None:
+            result.update(
+                lookups=stats.lookups,
+                mean_probes_per_lookup=stats.probes / stats.lookups if stats.lookups else 0.0,
+                max_probes_per_lookup=stats.max_probes,
+                resizes=stats.resizes,
+                resize_seconds=stats.resize_seconds,
+            )
+        return result
+
+    def reset_stats(self) -> None:
+        """Zero the lookup and resize counters (no-op when not tracking)."""
+        if self._stats is not None:
+            self._stats = _TableStats()
+
+    def __repr__(self) -> str:
+        if self._mode == "chaining":
+            return f"HashTable(capacity={self._capacity}, {self._store.describe()})"
+        return (
+            f"HashTable(capacity={self._capacity}, mode='open', "
+            f"probing={self._probing!r}, {self._store.describe()})"
+        )
+
+
+# ------------------------------------------------------------------
+# Thread-safe variant
+# ------------------------------------------------------------------
+
+class StripedHashTable:
+    """Thread-safe chaining hash table using lock striping.
+
+    Bucket `i` is guarded by lock `i % stripes`.  The bucket count is kept
+    a multiple of the stripe count, so a key's stripe is simply
+    `hash(key) % stripes` and never changes when the table grows.  Each
+    operation holds only its key's stripe lock; entry counts are kept per
+    stripe so no shared counter is written.  A resize takes every stripe
+    lock in index order (so two resizers cannot deadlock), re-checks the
+    load and that no other thread already grew the table, and then
+    rehashes.
+    """
+
+    def __init__(self, capacity: int = 16, *, stripes: int = 16, max_load_factor: float = 0.75) -> None:
+        if capacity <= 0 or stripes <= 0:
+            raise ValueError("Capacity and stripes must be positive")
+        if max_load_factor <= 0:
+            raise ValueError("max_load_factor must be positive")
+        capacity = -(-capacity // stripes) * stripes
+        self._stripes = stripes
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._counts = [0] * stripes
+        self._buckets: List[Optional[List[Tuple[Any, Any]]]] = [None] * capacity
+        self._max_load_factor = max_load_factor
+
+    @property
+    def _capacity(self) -> int:
+        return len(self._buckets)
+
+    def insert(self, key: Any, value: Any) -> None:
+        """Insert or update a key-value pair."""
+        h = hash(key)
+        stripe = h % self._stripes
+        with self._locks[stripe]:
+            buckets = self._buckets
+            idx = h % len(buckets)
+            bucket = buckets[idx]
+            if bucket is None:
+                bucket = buckets[idx] = []
+            for i, (k, _) in enumerate(bucket):
+                if k == key:
+                    bucket[i] = (key, value)
+                    return
+            bucket.append((key, value))
+            self._counts[stripe] += 1
+            capacity = len(buckets)
+        # unlocked read of the other stripes' counts; _resize re-checks the
+        # load and the capacity under every lock
+        if sum(self._counts) > self._max_load_factor * capacity:
+            self._resize(capacity)
+
+    def _lookup(self, key: Any) -> Any:
+        h = hash(key)
+        with self._locks[h % self._stripes]:
+            buckets = self._buckets
+            bucket = buckets[h % len(buckets)]
+            if bucket:
+                for k, v in bucket:
+                    if k == key:
+                        return v
+        return _MISSING
+
+    def search(self, key: Any) -> Any:
+        """Return the value associated with `key`, or raise KeyError."""
+        value = self._lookup(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the value for `key`, or `default` if it is absent."""
+        value = self._lookup(key)
+        return default if value is _MISSING else value
+
+    def delete(self, key: Any) -> None:
+        """Remove `key`, raising KeyError if it is not present."""
+        h = hash(key)
+        stripe = h % self._stripes
+        with self._locks[stripe]:
+            buckets = self._buckets
+            bucket = buckets[h % len(buckets)]
+            if bucket:
+                for i, (k, _) in enumerate(bucket):
+                    if k == key:
+                        del bucket[i]
+                        self._counts[stripe] -= 1
+                        return
         raise KeyError(key)
 
+    def _resize(self, expected_capacity: int) -> None:
+        """Double the bucket array while holding every stripe lock."""
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            if len(self._buckets) != expected_capacity:
+                return  # another thread already resized
+            if sum(self._counts) <= self._max_load_factor * expected_capacity:
+                return  # deletes brought the load back under the limit
+            new_capacity = expected_capacity * 2
+            new_buckets: List[Optional[List[Tuple[Any, Any]]]] = [None] * new_capacity
+            for bucket in self._buckets:
+                if not bucket:
+                    continue
+                for key, value in bucket:
+                    idx = hash(key) % new_capacity
+                    target = new_buckets[idx]
+                    if target is None:
+                        new_buckets[idx] = [(key, value)]
+                    else:
+                        target.append((key, value))
+            self._buckets = new_buckets
+        finally:
+            for lock in reversed(self._locks):
+                lock.release()
+
+    def items(self) -> List[Tuple[Any, Any]]:
+        """Return a consistent copy of all pairs, taken under every lock."""
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            return [entry for bucket in self._buckets if bucket for entry in bucket]
+        finally:
+            for lock in reversed(self._locks):
+                lock.release()
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.search(key)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.insert(key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        self.delete(key)
+
+    def __contains__(self, key: Any) -> bool:
+        return self._lookup(key) is not _MISSING
+
+    def __len__(self) -> int:
+        return sum(self._counts)
+
     def __repr__(self) -> str:
-        return f"HashTable(capacity={self._capacity}, buckets={self._buckets!r})"
+        return (
+            f"StripedHashTable(capacity={self._capacity}, stripes={self._stripes}, "
+            f"size={len(self)})"
+        )
+
+
+# ------------------------------------------------------------------
+# Persistent, memory-mapped variant
+# ------------------------------------------------------------------
+
+_DISK_MAGIC = b"HTBL"
+_DISK_VERSION = 1
+# magic, version, slot size, bucket count, end of overflow area, entry count
+_DISK_HEADER = struct.Struct("<4sHIQQQ")
+_DISK_HEADER_SIZE = mmap.PAGESIZE
+# used bytes of the inline area, offset of the newest overflow record
+_SLOT_HEADER = struct.Struct("<IQ")
+# next overflow record, live flag, key length, value length
+_RECORD_HEADER = struct.Struct("<QBHI")
+
+
+def _encode_key(key: Any) -> bytes:
+    """Serialise a key so equal keys give equal bytes in every process."""
+    if isinstance(key, str):
+        return b"s" + key.encode("utf-8")
+    if isinstance(key, bytes):
+        return b"b" + key
+    if isinstance(key, int) and not isinstance(key, bool):
+        return b"i" + str(key).encode("ascii")
+    raise TypeError("DiskHashTable keys must be str, bytes or int")
+
+
+def _decode_key(data: bytes) -> Any:
+    tag, body = data[:1], data[1:]
+    if tag == b"s":
+        return body.decode("utf-8")
+    if tag == b"b":
+        return bytes(body)
+    return int(body)
+
+
+def _stable_hash(data: bytes) -> int:
+    # str hashes are salted per process, so the on-disk layout needs its own
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+
+class DiskHashTable:
+    """Hash table stored in a memory-mapped file.
+
+    The file is a one-page header followed by `bucket_count` fixed-size
+    slots and then an append-only overflow area.  A slot starts with the
+    number of inline bytes used and the offset of its newest overflow
+    record, followed by records packed inline.  Slots divide the page
+    size and are page aligned, so a key stored inline is found with at
+    most one page fault.  Once a slot is full, further records for it are
+    prepended to a chain in the overflow area.
+
+    Records are never rewritten in place except for their one-byte live
+    flag.  Each change writes the new record's bytes first and then
+    publishes it by updating a slot or header field, so a crash leaves
+    at worst unreferenced bytes behind.  If an update is interrupted
+    before the old record is flagged dead, lookups still return the
+    newest copy.  With ``sync=True`` the map is flushed around every
+    publish step; otherwise call `flush()` when durability is needed.
+
+    Keys must be `str`, `bytes` or `int` so they hash identically after
+    a restart.  Values may be any picklable object.  `len` is kept in the
+    header and may lag by one entry after a crash.
+
+    Sizing: the one-page-fault bound holds only while records fit inline.
+    Updates and deletes leave dead records behind.  `compact()` rewrites
+    the file with live records only and can rehash into more buckets.
+    With ``auto_compact`` (the default), an insert that grows the overflow
+    area past the size of the slot area triggers `compact()`.  That keeps
+    overflow chains short and reclaims dead space, at the cost of an O(n)
+    rewrite whose expense is spread over the inserts that filled the
+    overflow area.
+    """
+
+    def __init__(self, path: str, handle, mm: mmap.mmap, sync: bool,
+                 auto_compact: bool = True) -> None:
+        """Use `DiskHashTable.open` rather than calling this directly."""
+        self.path = path
+        self._sync = sync
+        self._auto_compact = auto_compact
+        self._attach(handle, mm)
+
+    def _attach(self, handle, mm: mmap.mmap) -> None:
+        magic, version, slot_size, bucket_count, end, count = _DISK_HEADER.unpack_from(mm, 0)
+        if magic != _DISK_MAGIC or version != _DISK_VERSION:
+            raise ValueError(f"{self.path} is not a DiskHashTable file")
+        self._file = handle
+        self._mm = mm
+        self._slot_size = slot_size
+        self._bucket_count = bucket_count
+        self._data_start = _DISK_HEADER_SIZE + bucket_count * slot_size
+        self._end = end
+        self._count = count
+
+    @classmethod
+    def open(
+        cls,
+        path: str,
+        bucket_count: int = 1 << 16,
+        slot_size: int = 256,
+        sync: bool = False,
+        auto_compact: bool = True,
+    ) -> "DiskHashTable":
+        """Open the table at `path`, creating it if the file does not exist.
+
+        `bucket_count` and `slot_size` only apply when the file is created;
+        an existing file keeps the layout it was written with.  Opening an
+        existing table maps the file and reads the header, nothing more.
+        """
+        if os.path.exists(path):
+            handle = open(path, "r+b")
+        else:
+            if bucket_count <= 0:
+                raise ValueError("bucket_count must be positive")
+            if slot_size < 64 or mmap.PAGESIZE % slot_size:
+                raise ValueError("slot_size must be at least 64 and divide the page size")
+            data_start = _DISK_HEADER_SIZE + bucket_count * slot_size
+            handle = open(path, "w+b")
+            handle.truncate(data_start + mmap.PAGESIZE)
+            header = _DISK_HEADER.pack(_DISK_MAGIC, _DISK_VERSION, slot_size, bucket_count, data_start, 0)
+            handle.write(header)
+            handle.flush()
+        mm = mmap.mmap(handle.fileno(), 0)
+        return cls(path, handle, mm, sync, auto_compact)
+
+    # -- low-level helpers ---------------------------------------------
+
+    def _slot_offset(self, encoded: bytes) -> int:
+        return _DISK_HEADER_SIZE + (_stable_hash(encoded) % self._bucket_count) * self._slot_size
+
+    def _write_header(self) -> None:
+        self._mm[0:_DISK_HEADER.size] = _DISK_HEADER.pack(
+            _DISK_MAGIC, _DISK_VERSION, self._slot_size, self._bucket_count, self._end, self._count
+        )
+
+    def _barrier(self) -> None:
+        if self._sync:
+            self._mm.flush()
+
+    def _ensure_capacity(self, size: int) -> None:
+        if size <= len(self._mm):
+            return
+        new_size = max(size, len(self._mm) * 2)
+        self._mm.close()
+        self._file.truncate(new_size)
+        self._mm = mmap.mmap(self._file.fileno(), 0)
+
+    def _records(self, slot: int) -> Iterator[Tuple[int, bytes]]:
+        """Yield `(offset, key bytes)` of live records, newest first."""
+        mm = self._mm
+        used, overflow = _SLOT_HEADER.unpack_from(mm, slot)
+        offset = overflow
+        while offset:
+            nxt, live, klen, _ = _RECORD_HEADER.unpack_from(mm, offset)
+            if live:
+                start = offset + _RECORD_HEADER.size
+                yield offset, mm[start:start + klen]
+            offset = nxt
+        inline: List[Tuple[int, bytes]] = []
+        offset = slot + _SLOT_HEADER.size
+        stop = offset + used
+        while offset < stop:
+            _, live, klen, vlen = _RECORD_HEADER.unpack_from(mm, offset)
+            if live:
+                start = offset + _RECORD_HEADER.size
+                inline.append((offset, mm[start:start + klen]))
+            offset += _RECORD_HEADER.size + klen + vlen
+        yield from reversed(inline)
+
+    def _find(self, slot: int, encoded: bytes) -> int:
+        for offset, key_bytes in self._records(slot):
+            if key_bytes == encoded:
+                return offset
+        return 0
+
+    def _read_value(self, offset: int) -> Any:
+        _, _, klen, vlen = _RECORD_HEADER.unpack_from(self._mm, offset)
+        start = offset + _RECORD_HEADER.size + klen
+        return pickle.loads(self._mm[start:start + vlen])
+
+    # -- public operations --------------------------------------------
+
+    def insert(self, key: Any, value: Any) -> None:
+        """Insert or update a key-value pair."""
+        self._put(_encode_key(key), pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+        if self._auto_compact and self._end - self._data_start > self._data_start - _DISK_HEADER_SIZE:
+            self.compact()
+
+    def _put(self, encoded: bytes, payload: bytes, is_new: bool = False) -> None:
+        """Write one record; `is_new` skips the lookup for an existing copy."""
+        slot = self._slot_offset(encoded)
+        previous = 0 if is_new else self._find(slot, encoded)
+        used, overflow = _SLOT_HEADER.unpack_from(self._mm, slot)
+        size = _RECORD_HEADER.size + len(encoded) + len(payload)
+        if not overflow and _SLOT_HEADER.size + used + size <= self._slot_size:
+            offset = slot + _SLOT_HEADER.size + used
+            self._mm[offset:offset + size] = (
+                _RECORD_HEADER.pack(0, 1, len(encoded), len(payload)) + encoded + payload
+            )
+            self._barrier()
+            _SLOT_HEADER.pack_into(self._mm, slot, used + size, 0)
+        else:
+            offset = self._end
+            self._ensure_capacity(offset + size)
+            self._mm[offset:offset + size] = (
+                _RECORD_HEADER.pack(overflow, 1, len(encoded), len(payload)) + encoded + payload
+            )
+            # reserve the bytes before linking them so a crash cannot reuse them
+            self._end = offset + size
+            self._write_header()
+            self._barrier()
+            _SLOT_HEADER.pack_into(self._mm, slot, used, offset)
+        if previous:
+            self._mm[previous + 8] = 0
+        else:
+            self._count += 1
+            self._write_header()
+        self._barrier()
+
+    def search(self, key: Any) -> Any:
+        """Return the value associated with `key`, or raise KeyError."""
+        encoded = _encode_key(key)
+        offset = self._find(self._slot_offset(encoded), encoded)
+        if not offset:
+            raise KeyError(key)
+        return self._read_value(offset)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the value for `key`, or `default` if it is absent."""
+        encoded = _encode_key(key)
+        offset = self._find(self._slot_offset(encoded), encoded)
+        return self._read_value(offset) if offset else default
+
+    def delete(self, key: Any) -> None:
+        """Remove `key`, raising KeyError if it is not present."""
+        encoded = _encode_key(key)
+        slot = self._slot_offset(encoded)
+        found = False
+        # flag every live copy, including one left behind by a crash
+        for offset, key_bytes in list(self._records(slot)):
+            if key_bytes == encoded:
+                self._mm[offset + 8] = 0
+                found = True
+        if not found:
+            raise KeyError(key)
+        self._count -= 1
+        self._write_header()
+        self._barrier()
+
+    def _live_records(self) -> Iterator[Tuple[bytes, int]]:
+        """Yield `(key bytes, offset)` of the newest live copy of every key."""
+        for bucket in range(self._bucket_count):
+            seen = set()
+            for offset, key_bytes in self._records(_DISK_HEADER_SIZE + bucket * self._slot_size):
+                if key_bytes not in seen:
+                    seen.add(key_bytes)
+                    yield key_bytes, offset
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        """Lazily yield every live `(key, value)` pair, bucket by bucket."""
+        for key_bytes, offset in self._live_records():
+            yield _decode_key(key_bytes), self._read_value(offset)
+
+    def compact(self, bucket_count: Optional[int] = None) -> None:
+        """Rewrite the file with live records only, rehashing if needed.
+
+        Without `bucket_count`, buckets are doubled until the live records
+        would fill at most half of the inline slot space; the table never
+        shrinks on its own.  The new file is written beside the old one,
+        fsynced and renamed over it, so a crash leaves one complete table.
+        """
+        mm = self._mm
+        if bucket_count is None:
+            live_bytes = 0
+            for _, offset in self._live_records():
+                _, _, klen, vlen = _RECORD_HEADER.unpack_from(mm, offset)
+                live_bytes += _RECORD_HEADER.size + klen + vlen
+            inline_room = self._slot_size - _SLOT_HEADER.size
+            bucket_count = self._bucket_count
+            while bucket_count * inline_room < 2 * live_bytes:
+                bucket_count *= 2
+        elif bucket_count <= 0:
+            raise ValueError("bucket_count must be positive")
+
+        tmp_path = self.path + ".compact"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)  # left over from an interrupted compaction
+        fresh = DiskHashTable.open(tmp_path, bucket_count=bucket_count,
+                                   slot_size=self._slot_size, auto_compact=False)
+        try:
+            for key_bytes, offset in self._live_records():
+                _, _, klen, vlen = _RECORD_HEADER.unpack_from(mm, offset)
+                start = offset + _RECORD_HEADER.size + klen
+                fresh._put(key_bytes, mm[start:start + vlen], is_new=True)
+            fresh._mm.flush()
+            os.fsync(fresh._file.fileno())
+        finally:
+            fresh.close()
+        self._mm.close()
+        self._file.close()
+        os.replace(tmp_path, self.path)
+        if hasattr(os, "O_DIRECTORY"):
+            dir_fd = os.open(os.path.dirname(os.path.abspath(self.path)), os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        handle = open(self.path, "r+b")
+        self._attach(handle, mmap.mmap(handle.fileno(), 0))
+
+    def keys(self) -> Iterator[Any]:
+        for key, _ in self.items():
+            yield key
+
+    def flush(self) -> None:
+        """Write all pending changes in the map back to the file."""
+        self._mm.flush()
+
+    def close(self) -> None:
+        """Flush and release the mapping and file handle."""
+        if self._mm.closed:
+            return
+        self._mm.flush()
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self) -> "DiskHashTable":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.search(key)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.insert(key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        self.delete(key)
+
+    def __contains__(self, key: Any) -> bool:
+        encoded = _encode_key(key)
+        return bool(self._find(self._slot_offset(encoded), encoded))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __repr__(self) -> str:
+        return (
+            f"DiskHashTable(path={self.path!r}, buckets={self._bucket_count}, "
+            f"size={self._count})"
+        )
+
+
+# ------------------------------------------------------------------
+# Benchmark
+# ------------------------------------------------------------------
+
+def _time_ops(table: HashTable, keys: List[Any], misses: List[Any]) -> Tuple[float, float, float, float]:
+    """Return per-op microseconds for insert, hit, miss and delete."""
+    start = time.perf_counter()
+    for key in keys:
+        table.insert(key, key)
+    insert_us = (time.perf_counter() - start) / len(keys) * 1e6
+
+    start = time.perf_counter()
+    for key in keys:
+        table.search(key)
+    hit_us = (time.perf_counter() - start) / len(keys) * 1e6
+
+    start = time.perf_counter()
+    for key in misses:
+        try:
+            table.search(key)
+        except KeyError:
+            pass
+    miss_us = (time.perf_counter() - start) / len(misses) * 1e6
+
+    start = time.perf_counter()
+    for key in keys:
+        table.delete(key)
+    delete_us = (time.perf_counter() - start) / len(keys) * 1e6
+    return insert_us, hit_us, miss_us, delete_us
+
+
+def benchmark_modes(capacity: int = 1 << 16, load_factors=(0.25, 0.5, 0.75, 0.9)) -> None:
+    """Compare chaining and open addressing at fixed load factors.
+
+    Each table is created at `capacity` with resizing effectively off, then
+    filled to the target load factor so every mode sees the same density.
+    """
+    variants = [
+        ("chaining", dict(mode="chaining", max_load_factor=None)),
+        ("open/linear", dict(mode="open", probing="linear", max_load_factor=0.99)),
+        ("open/robin_hood", dict(mode="open", probing="robin_hood", max_load_factor=0.99)),
+    ]
+    print("\nHash table storage modes (per-op times in microseconds)")
+    print(f"{'Load':>6} {'Mode':<18}{'Insert':>10}{'Hit':>10}{'Miss':>10}{'Delete':>10}")
+    for load in load_factors:
+        n = int(capacity * load)
+        keys = [f"key-{random.getrandbits(48)}" for _ in range(n)]
+        misses = [f"miss-{random.getrandbits(48)}" for _ in range(min(n, 10_000))]
+        for label, options in variants:
+            table = HashTable(capacity, **options)
+            insert_us, hit_us, miss_us, delete_us = _time_ops(table, keys, misses)
+            print(f"{load:>6.2f} {label:<18}{insert_us:>10.3f}{hit_us:>10.3f}{miss_us:>10.3f}{delete_us:>10.3f}")
+
+
+def benchmark_resize_latency(n: int = 500_000) -> None:
+    """Show how incremental rehashing flattens the worst single insert."""
+    print("\nInsert latency while growing from 8 buckets (milliseconds)")
+    print(f"{'Mode':<18}{'Incremental':>12}{'Total':>10}{'Worst insert':>14}")
+    for mode in ("chaining", "open"):
+        for incremental in (False, True):
+            table = HashTable(mode=mode, incremental=incremental)
+            worst = 0.0
+            clock = time.perf_counter
+            total_start = clock()
+            for i in range(n):
+                start = clock()
+                table.insert(i, i)
+                elapsed = clock() - start
+                if elapsed > worst:
+                    worst = elapsed
+            total = clock() - total_start
+            print(f"{mode:<18}{str(incremental):>12}{total * 1e3:>10.1f}{worst * 1e3:>14.3f}")
+    print("\nNote: results vary by system load and Python interpreter.")
+
+
+class _GlobalLockTable:
+    """Baseline for `benchmark_concurrency`: a `HashTable` behind one lock."""
+
+    def __init__(self) -> None:
+        self._table = HashTable(16)
+        self._lock = threading.Lock()
+
+    def insert(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._table.insert(key, value)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        with self._lock:
+            return self._table.get(key, default)
+
+
+def benchmark_concurrency(threads=(1, 2, 4, 8, 16), ops_per_thread: int = 50_000, read_ratio: float = 0.9) -> None:
+    """Compare `StripedHashTable` with a single global lock under threads.
+
+    Each thread runs a mix of `get` and `insert` calls over a shared key
+    space that was filled beforehand; throughput is total operations per
+    second.  On a GIL build the interpreter serialises bytecode anyway, so
+    striping mostly shows up as lower lock hand-off cost; free-threaded
+    builds let the stripes run in parallel.
+    """
+    key_space = 100_000
+    print(f"\nConcurrent throughput ({read_ratio:.0%} reads, ops/second)")
+    print(f"{'Threads':>8}{'Global lock':>16}{'Striped':>16}")
+    for count in threads:
+        results = []
+        for factory in (_GlobalLockTable, StripedHashTable):
+            table = factory()
+            for i in range(key_space):
+                table.insert(i, i)
+            plans = [
+                [(random.random() < read_ratio, random.randrange(key_space)) for _ in range(ops_per_thread)]
+                for _ in range(count)
+            ]
+            barrier = threading.Barrier(count + 1)
+
+            def worker(plan):
+                barrier.wait()
+                for is_read, key in plan:
+                    if is_read:
+                        table.get(key)
+                    else:
+                        table.insert(key, key)
+
+            workers = [threading.Thread(target=worker, args=(plan,)) for plan in plans]
+            for thread in workers:
+                thread.start()
+            barrier.wait()
+            start = time.perf_counter()
+            for thread in workers:
+                thread.join()
+            results.append(count * ops_per_thread / (time.perf_counter() - start))
+        print(f"{count:>8}{results[0]:>16,.0f}{results[1]:>16,.0f}")
+
+
+def benchmark_disk(n: int = 200_000) -> None:
+    """Compare reopening a `DiskHashTable` with rebuilding a `HashTable`."""
+    keys = [f"sku-{i}" for i in range(n)]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "table.htbl")
+        start = time.perf_counter()
+        with DiskHashTable.open(path, bucket_count=max(1024, n // 4)) as table:
+            for key in keys:
+                table.insert(key, len(key))
+        write_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        table = DiskHashTable.open(path)
+        table.search(keys[0])
+        reopen_ms = (time.perf_counter() - start) * 1e3
+
+        sample = random.sample(keys, min(n, 10_000))
+        start = time.perf_counter()
+        for key in sample:
+            table.search(key)
+        disk_us = (time.perf_counter() - start) / len(sample) * 1e6
+
+        # rewrite every value several times; compaction keeps the file bounded
+        loaded_mb = os.path.getsize(path) / 1e6
+        start = time.perf_counter()
+        for round_ in range(5):
+            for key in keys:
+                table.insert(key, round_)
+        churn_s = time.perf_counter() - start
+        churned_mb = os.path.getsize(path) / 1e6
+        table.close()
+
+    start = time.perf_counter()
+    memory = HashTable()
+    for key in keys:
+        memory.insert(key, len(key))
+    rebuild_ms = (time.perf_counter() - start) * 1e3
+
+    print(f"\nDisk-backed table, n={n}")
+    print(f"{'Initial load (s)':<28}{write_s:>12.3f}")
+    print(f"{'Reopen + first lookup (ms)':<28}{reopen_ms:>12.3f}")
+    print(f"{'Rebuild in memory (ms)':<28}{rebuild_ms:>12.3f}")
+    print(f"{'Disk lookup (us)':<28}{disk_us:>12.3f}")
+    print(f"{'5 update rounds (s)':<28}{churn_s:>12.3f}")
+    print(f"{'File MB: loaded/updated':<28}{loaded_mb:>6.1f}/{churned_mb:<5.1f}")
+
+
+class _CollidingStr(str):
+    """String whose hash is constant, modelling a flood of colliding keys."""
+
+    __slots__ = ()
+
+    def __hash__(self) -> int:
+        return 42
+
+
+def _adversarial_key_sets(n: int) -> Dict[str, List[Any]]:
+    return {
+        "random strings": [f"user-{random.getrandbits(40):x}" for _ in range(n)],
+        "sequential ints": list(range(n)),
+        "strided ints (i << 20)": [i << 20 for i in range(n)],
+        "same-hash strings": [_CollidingStr(f"key{i}") for i in range(n)],
+    }
+
+
+def stress_keys(n: int = 2_000) -> None:
+    """Feed adversarial key sets through every mode and report degradation.
+
+    Sequential ints hash to themselves and strided ints share their low
+    bits, so both stress `hash(key) % capacity`; same-hash strings defeat
+    every mode.  For each set the table is filled, every key is looked up
+    once, and the recorded probe counts and chain lengths are printed.
+    """
+    variants = [
+        ("chaining", dict(mode="chaining")),
+        ("open/linear", dict(mode="open", probing="linear")),
+        ("open/robin_hood", dict(mode="open", probing="robin_hood")),
+    ]
+    print(f"\nAdversarial key sets, n={n}")
+    print(f"{'Key set':<24}{'Mode':<18}{'Mean probes':>12}{'Max probes':>12}"
+          f"{'Max chain':>11}{'Lookup (us)':>13}{'Resize (ms)':>13}")
+    for label, keys in _adversarial_key_sets(n).items():
+        for mode_label, options in variants:
+            table = HashTable(track_stats=True, **options)
+            for key in keys:
+                table.insert(key, None)
+            start = time.perf_counter()
+            for key in keys:
+                table.get(key)
+            lookup_us = (time.perf_counter() - start) / n * 1e6
+            report = table.stats()
+            print(f"{label:<24}{mode_label:<18}{report['mean_probes_per_lookup']:>12.2f}"
+                  f"{report['max_probes_per_lookup']:>12}{report['max_chain_length']:>11}"
+                  f"{lookup_us:>13.2f}{report['resize_seconds'] * 1e3:>13.2f}")
+    print("\nLookup times include probe counting, so compare them across rows only.")
 
 
 # ------------------------------------------------------------------
@@ -72,6 +1378,16 @@ class HashTable:
 # ------------------------------------------------------------------
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--benchmark":
+        benchmark_modes()
+        benchmark_resize_latency()
+        benchmark_concurrency()
+        benchmark_disk()
+        sys.exit(0)
+    if len(sys.argv) > 1 and sys.argv[1] == "--stress":
+        stress_keys()
+        sys.exit(0)
+
     table = HashTable(capacity=4)  # small to force collisions
     print("Initial table:", table)
 
@@ -81,7 +1397,7 @@ if __name__ == "__main__":
         print(f"insert {k} -> {v}")
         table.insert(k, v)
 
-    print("Table after inserts:", table)
+    print("Table after inserts (resized past load factor 0.75):", table)
 
     # search existing and non-existing
     print("search apple:", table.search("apple"))
@@ -103,3 +1419,64 @@ if __name__ == "__main__":
         table.delete("pear")
     except KeyError:
         print("pear not found, cannot delete")
+
+    # mapping-style access
+    table["kiwi"] = 5
+    print("len:", len(table), "| 'kiwi' in table:", "kiwi" in table)
+    print("get pear with default:", table.get("pear", 0))
+    print("items:", list(table.items()))
+
+    # collision statistics
+    tracked = HashTable(capacity=4, track_stats=True)
+    for k, v in pairs:
+        tracked.insert(k, v)
+    tracked.get("apple")
+    tracked.get("orange")
+    print("stats:", tracked.stats())
+
+    # thread-safe table shared by several writers
+    shared = StripedHashTable(stripes=4)
+    writers = [
+        threading.Thread(target=lambda base=base: [shared.insert(base + i, i) for i in range(100)])
+        for base in (0, 1000, 2000)
+    ]
+    for writer in writers:
+        writer.start()
+    for writer in writers:
+        writer.join()
+    print("\nStriped table after 3 writer threads:", shared)
+
+    # persistent table: data survives closing and reopening the file
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        disk_path = os.path.join(tmp_dir, "fruits.htbl")
+        with DiskHashTable.open(disk_path, bucket_count=64) as disk:
+            for k, v in pairs:
+                disk[k] = v
+            del disk["grape"]
+        with DiskHashTable.open(disk_path) as disk:
+            print("Reopened disk table:", disk, dict(disk.items()))
+
+    # the same operations using open addressing with Robin Hood probing
+    open_table = HashTable(capacity=4, mode="open", probing="robin_hood")
+    for k, v in pairs:
+        open_table.insert(k, v)
+    open_table.delete("grape")
+    print("\nOpen addressing table:", open_table)
+
+    # small open-addressing tables must keep an empty slot whatever the load
+    # factor allows, or a lookup of a missing key would probe forever; each
+    # lookup runs in a daemon thread so a regression fails instead of hanging
+    for capacity, limit in ((2, 0.9), (4, 0.75), (16, 0.95)):
+        for probing in ("linear", "robin_hood"):
+            small = HashTable(capacity=capacity, mode="open", probing=probing,
+                              max_load_factor=limit, incremental=True, migrate_step=1)
+            for i in range(64):
+                small.insert(f"key{i}", i)
+                lookup = threading.Thread(target=small.get, args=("missing",), daemon=True)
+                lookup.start()
+                lookup.join(timeout=5)
+                if lookup.is_alive() or small.load_factor >= 1:
+                    raise RuntimeError(f"open-addressing table filled up ({capacity=}, {limit=}, {probing=})")
+            if any(small[f"key{i}"] != i for i in range(64)):
+                raise RuntimeError(f"open-addressing table lost a key ({capacity=}, {limit=}, {probing=})")
+    print("Small open-addressing tables always kept an empty slot")
@@ -1,5 +1,20 @@
+import heapq
+import math
+import operator
+import random
+import re
+import sys
+import time
+from array import array
+from bisect import bisect_left, insort
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from itertools import compress
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # ColumnarInventory is unavailable without numpy
+    np = None
 
 @dataclass
 class Product:
@@ -9,21 +24,432 @@ class Product:
     stock_quantity: int
 
 
+class SortedIndex:
+    """Products kept ordered by one numeric attribute.
+
+    Entries are ordered by (value, seq), where seq is the product's position
+    in insertion order, so ties come out in the same order as the stable
+    merge sort.  Range lookups are a bisect plus a slice: O(log n + k).
+    The key each seq was indexed under is remembered, so an entry can be
+    removed even if the product's attribute was changed behind our back.
+    """
+
+    def __init__(self, attr: str):
+        self.attr = attr
+        self._keys: List[Tuple[float, int]] = []
+        self._items: List[Product] = []
+        self._key_of: Dict[int, Tuple[float, int]] = {}
+
+    def build(self, entries: List[Tuple[int, Product]]) -> None:
+        """Replace the contents with (seq, product) pairs, sorting once."""
+        attr = self.attr
+        keys = [(getattr(product, attr), seq) for seq, product in entries]
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        self._keys = [keys[i] for i in order]
+        self._items = [entries[i][1] for i in order]
+        self._key_of = {key[1]: key for key in keys}
+
+    def add(self, seq: int, product: Product) -> None:
+        key = (getattr(product, self.attr), seq)
+        i = bisect_left(self._keys, key)
+        self._keys.insert(i, key)
+        self._items.insert(i, product)
+        self._key_of[seq] = key
+
+    def remove(self, seq: int) -> None:
+        """Drop the entry added for `seq`; raises KeyError if there is none."""
+        key = self._key_of.pop(seq)
+        i = bisect_left(self._keys, key)
+        del self._keys[i]
+        del self._items[i]
+
+    def between(self, lo: float, hi: float) -> List[Product]:
+        """Products with lo <= value <= hi, in ascending order."""
+        start = bisect_left(self._keys, (lo,))
+        stop = bisect_left(self._keys, (hi, math.inf))
+        return self._items[start:stop]
+
+    def smallest(self, k: Optional[int] = None) -> List[Product]:
+        return self._items[:k]
+
+    def largest(self, k: Optional[int] = None) -> List[Product]:
+        """The k largest values, descending, ties still in insertion order."""
+        result: List[Product] = []
+        for product in self.descending():
+            if k is not None and len(result) >= k:
+                break
+            result.append(product)
+        return result
+
+    def descending(self) -> Iterator[Product]:
+        """Walk from the largest value down, one run of equal values at a time."""
+        items = self._items
+        for start, stop in self._runs_descending():
+            yield from items[start:stop]
+
+    def descending_keys(self) -> Iterator[Tuple[float, int]]:
+        """(value, seq) keys in the same order as `descending`."""
+        keys = self._keys
+        for start, stop in self._runs_descending():
+            yield from keys[start:stop]
+
+    def _runs_descending(self) -> Iterator[Tuple[int, int]]:
+        keys = self._keys
+        stop = len(keys)
+        while stop:
+            start = bisect_left(keys, (keys[stop - 1][0],), 0, stop)
+            yield start, stop
+            stop = start
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric words of `text`."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+# _intersect bisects the longer list once it is this many times longer than
+# the shorter one: one bisect into an array costs about as much as scanning
+# that many posting entries in C.
+_GALLOP_RATIO = 20
+
+
+def _intersect(ids: Sequence[int], posting: Sequence[int]) -> Sequence[int]:
+    """Sorted ids present in both sorted sequences."""
+    if len(ids) > len(posting):
+        ids, posting = posting, ids
+    if len(ids) * _GALLOP_RATIO < len(posting):
+        result = []
+        lo, stop = 0, len(posting)
+        for doc_id in ids:
+            lo = bisect_left(posting, doc_id, lo)
+            if lo == stop:
+                break
+            if posting[lo] == doc_id:
+                result.append(doc_id)
+        return result
+    return sorted(set(ids).intersection(posting))
+
+
+class InvertedIndex:
+    """Word -> posting list of document ids, for product name search.
+
+    Posting lists are `array('q')` buffers kept sorted.  New products get
+    increasing ids, so adding one is usually an append.  A sorted
+    vocabulary list turns a prefix into one bisected slice of terms.  Per
+    document term frequencies are kept for ranking, and documents that
+    repeat a word are tracked separately: every other document scores
+    exactly one per matched term.
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, array] = {}
+        self._terms: List[str] = []
+        self._tf: Dict[int, Dict[str, int]] = {}
+        self._repeated: Set[int] = set()
+
+    def add(self, doc_id: int, text: str) -> None:
+        tokens = tokenize(text)
+        counts: Dict[str, int] = {}
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+        self._tf[doc_id] = counts
+        if len(counts) < len(tokens):
+            self._repeated.add(doc_id)
+        for term in counts:
+            posting = self._postings.get(term)
+            if posting is None:
+                posting = self._postings[term] = array("q")
+                insort(self._terms, term)
+            if not posting or posting[-1] < doc_id:
+                posting.append(doc_id)
+            else:
+                posting.insert(bisect_left(posting, doc_id), doc_id)
+
+    def remove(self, doc_id: int) -> None:
+        self._repeated.discard(doc_id)
+        for term in self._tf.pop(doc_id, ()):
+            posting = self._postings[term]
+            del posting[bisect_left(posting, doc_id)]
+            if not posting:
+                del self._postings[term]
+                del self._terms[bisect_left(self._terms, term)]
+
+    def expand(self, token: str, prefix: bool) -> List[str]:
+        """Indexed terms equal to `token`, or starting with it when `prefix`."""
+        if not prefix:
+            return [token] if token in self._postings else []
+        start = bisect_left(self._terms, token)
+        stop = bisect_left(self._terms, token + "\U0010ffff", start)
+        return self._terms[start:stop]
+
+    def document_frequency(self, terms: List[str]) -> int:
+        """Total posting length of `terms`: an upper bound on their hits."""
+        return sum(len(self._postings[term]) for term in terms)
+
+    def term_frequency(self, doc_id: int, terms: List[str]) -> int:
+        counts = self._tf.get(doc_id, {})
+        return sum(counts.get(term, 0) for term in terms)
+
+    def contains_all(self, doc_id: int, terms: List[str]) -> bool:
+        counts = self._tf.get(doc_id, {})
+        return all(term in counts for term in terms)
+
+    def scores(self, doc_ids: Sequence[int], terms: List[str]) -> List[int]:
+        """`term_frequency` of each document, for distinct `terms`.
+
+        A document without repeated words scores the number of `terms` it
+        contains, which is a set intersection per document done in C; only
+        the few documents in `_repeated` need their counts summed.
+        """
+        wanted = set(terms)
+        result = list(map(len, map(wanted.intersection, map(self._tf.__getitem__, doc_ids))))
+        for i in compress(range(len(doc_ids)), map(self._repeated.__contains__, doc_ids)):
+            result[i] = self.term_frequency(doc_ids[i], terms)
+        return result
+
+    def boosted(self, terms: List[str], budget: int) -> Optional[List[int]]:
+        """Documents containing all distinct `terms` that repeat one of them.
+
+        These are the only documents scoring above len(terms).  Returns None
+        when more than `budget` documents repeat a word, so the caller can
+        fall back to scoring every hit.
+        """
+        if len(self._repeated) > budget:
+            return None
+        return [
+            doc_id for doc_id in self._repeated
+            if self.contains_all(doc_id, terms) and self.term_frequency(doc_id, terms) > len(terms)
+        ]
+
+    def match(self, expanded: List[List[str]], mode: str = "and") -> Sequence[int]:
+        """Ids of documents matching the expanded query words, unordered."""
+        if mode not in ("and", "or"):
+            raise ValueError(f"Unknown query mode {mode!r}")
+        matched = [terms for terms in expanded if terms]
+        if not matched or (mode == "and" and len(matched) < len(expanded)):
+            return []
+        postings = self._postings
+        if mode == "or":
+            return list(set().union(*(postings[term] for terms in matched for term in terms)))
+        # AND: intersect the sorted posting lists, smallest word first, so
+        # the running result only shrinks.  A word with several prefix
+        # expansions is intersected term by term and the pieces merged,
+        # rather than building the union of its (possibly huge) postings.
+        matched.sort(key=self.document_frequency)
+        first = matched[0]
+        result = postings[first[0]] if len(first) == 1 else sorted(set().union(*map(postings.__getitem__, first)))
+        for terms in matched[1:]:
+            if len(terms) == 1:
+                result = _intersect(result, postings[terms[0]])
+            else:
+                result = sorted(set().union(*(_intersect(result, postings[term]) for term in terms)))
+            if not result:
+                break
+        return result
+
+
+_STOCK = operator.attrgetter("stock_quantity")
+
+
 class Inventory:
-    """Inventory system with fast search and stable sorting."""
+    """Inventory system with fast search and stable sorting.
+
+    Products are owned by the inventory's indexes.  Use `add_product`,
+    `remove_product`, `update_stock`, `update_price` or `apply_changes`
+    to change them.  `products` returns a read-only tuple snapshot in
+    insertion order.  Assigning a new sequence to it replaces the whole
+    catalogue and rebuilds every index.  Product ids must be unique: the
+    constructor raises ValueError on a duplicate instead of keeping only
+    the last one.
+    """
+
+    # apply_changes switches from per-row updates to a single re-sort of the
+    # sorted indexes once a batch touches more than this fraction of products.
+    BULK_FRACTION = 1 / 32
+
+    # search_text walks the stock index for at most this many products per
+    # entry of the rarest term's postings: a visit is one Python-level dict
+    # probe, about what intersecting and ranking costs per posting entry.
+    STOCK_WALK_VISITS_PER_POSTING = 1
 
     def __init__(self, products: List[Product]):
-        self.products = products
         self.id_index: Dict[str, Product] = {}
         self.name_index: Dict[str, List[Product]] = {}
+        self.price_index = SortedIndex("price")
+        self.quantity_index = SortedIndex("stock_quantity")
+        self._seq: Dict[str, int] = {}
+        self._by_seq: Dict[int, Product] = {}
+        self._name_of: Dict[int, str] = {}
+        self.text_index = InvertedIndex()
+        self._next_seq = 0
+        self.products = products
+
+    @property
+    def products(self) -> Tuple[Product, ...]:
+        """All products in insertion order, as a read-only snapshot."""
+        return tuple(self.id_index.values())
+
+    @products.setter
+    def products(self, products: Iterable[Product]) -> None:
+        id_index: Dict[str, Product] = {}
+        for product in products:
+            if product.product_id in id_index:
+                raise ValueError(f"Duplicate product id {product.product_id!r}")
+            id_index[product.product_id] = product
+        self.id_index = id_index
         self._build_indices()
 
     def _build_indices(self) -> None:
-        """Build lookup dictionaries for fast product search."""
-        for product in self.products:
-            self.id_index[product.product_id] = product
+        """Build lookup dictionaries and sorted indexes for fast product search."""
+        self.name_index = {}
+        self._seq = {}
+        self._by_seq = {}
+        self._name_of = {}
+        self.text_index = InvertedIndex()
+        for seq, product in enumerate(self.id_index.values()):
+            self._seq[product.product_id] = seq
+            self._by_seq[seq] = product
+            self.text_index.add(seq, product.name)
             key = product.name.lower()
+            self._name_of[seq] = key
             self.name_index.setdefault(key, []).append(product)
+        self._next_seq = len(self._seq)
+        self._rebuild_sorted_indices()
+
+    def _rebuild_sorted_indices(self) -> None:
+        seq = self._seq
+        entries = [(seq[pid], product) for pid, product in self.id_index.items()]
+        self.price_index.build(entries)
+        self.quantity_index.build(entries)
+
+    def _get(self, product_id: str) -> Product:
+        product = self.id_index.get(product_id)
+        if product is None:
+            raise KeyError(f"No product with id {product_id!r}")
+        return product
+
+    # ------------------------------------------------------------------
+    # Mutations: every index is updated in place, nothing is rebuilt.
+    # Sorted indexes cost O(log n) to locate an entry plus a list insert/delete.
+    # ------------------------------------------------------------------
+
+    def add_product(self, product: Product) -> None:
+        """Add a new product; raises ValueError if its id is already present."""
+        self._add(product, sorted_indexes=True)
+
+    def remove_product(self, product_id: str) -> Product:
+        """Remove and return a product; raises KeyError if it is unknown."""
+        return self._remove(product_id, sorted_indexes=True)
+
+    def update_stock(self, product_id: str, quantity: int) -> Product:
+        """Set a product's stock_quantity and return the product."""
+        product = self._get(product_id)
+        seq = self._seq[product_id]
+        self.quantity_index.remove(seq)
+        product.stock_quantity = quantity
+        self.quantity_index.add(seq, product)
+        return product
+
+    def update_price(self, product_id: str, price: float) -> Product:
+        """Set a product's price and return the product."""
+        product = self._get(product_id)
+        seq = self._seq[product_id]
+        self.price_index.remove(seq)
+        product.price = price
+        self.price_index.add(seq, product)
+        return product
+
+    def _add(self, product: Product, sorted_indexes: bool) -> None:
+        if product.product_id in self.id_index:
+            raise ValueError(f"Product id {product.product_id!r} already exists")
+        seq = self._next_seq
+        self._next_seq += 1
+        self.id_index[product.product_id] = product
+        self._seq[product.product_id] = seq
+        self._by_seq[seq] = product
+        self.text_index.add(seq, product.name)
+        key = product.name.lower()
+        self._name_of[seq] = key
+        self.name_index.setdefault(key, []).append(product)
+        if sorted_indexes:
+            self.price_index.add(seq, product)
+            self.quantity_index.add(seq, product)
+
+    def _remove(self, product_id: str, sorted_indexes: bool) -> Product:
+        # Index entries are found through the keys recorded when the product
+        # was added, not its current fields, and everything that can raise
+        # happens before the first structure is touched.
+        product = self._get(product_id)
+        seq = self._seq[product_id]
+        key = self._name_of[seq]
+        same_name = self.name_index[key]
+        if sorted_indexes:
+            self.price_index.remove(seq)
+            self.quantity_index.remove(seq)
+        del self.id_index[product_id]
+        del self._seq[product_id]
+        del self._by_seq[seq]
+        del self._name_of[seq]
+        self.text_index.remove(seq)
+        for i, candidate in enumerate(same_name):
+            if candidate is product:
+                del same_name[i]
+                break
+        if not same_name:
+            del self.name_index[key]
+        return product
+
+    def apply_changes(self, batch: Iterable[tuple]) -> int:
+        """Apply a feed of changes and return how many were applied.
+
+        Each change is one of:
+            ("add", Product)
+            ("remove", product_id)
+            ("stock", product_id, quantity)
+            ("price", product_id, price)
+
+        Small batches go through the single-product methods.  Large ones
+        update the dictionaries and product fields row by row, then re-sort
+        the price and quantity indexes once.  A bad row raises after the
+        rows before it have been applied, and the indexes stay consistent.
+        """
+        changes = batch if isinstance(batch, list) else list(batch)
+        if len(changes) <= max(64, len(self.id_index) * self.BULK_FRACTION):
+            handlers = {
+                "add": self.add_product,
+                "remove": self.remove_product,
+                "stock": self.update_stock,
+                "price": self.update_price,
+            }
+            for change in changes:
+                handler = handlers.get(change[0])
+                if handler is None:
+                    raise ValueError(f"Unknown change type {change[0]!r}")
+                handler(*change[1:])
+            return len(changes)
+
+        try:
+            for change in changes:
+                op = change[0]
+                if op == "stock":
+                    self._get(change[1]).stock_quantity = change[2]
+                elif op == "price":
+                    self._get(change[1]).price = change[2]
+                elif op == "add":
+                    self._add(change[1], sorted_indexes=False)
+                elif op == "remove":
+                    self._remove(change[1], sorted_indexes=False)
+                else:
+                    raise ValueError(f"Unknown change type {op!r}")
+        finally:
+            self._rebuild_sorted_indices()
+        return len(changes)
 
     def search_by_id(self, product_id: str) -> Optional[Product]:
         """Search a product by its ID in O(1) average time."""
@@ -33,13 +459,258 @@ class Inventory:
         """Search products by name in O(1) average time for exact name lookup."""
         return self.name_index.get(name.lower(), [])
 
+    def search_text(
+        self,
+        query: str,
+        mode: str = "and",
+        prefix: bool = True,
+        limit: Optional[int] = None,
+    ) -> List[Product]:
+        """Full-text search over product names.
+
+        Every query word must match ("and") or any may match ("or").  With
+        `prefix`, a word matches any indexed word that starts with it, so
+        "wid" finds "Widget".  Results are ranked by how often the matched
+        words occur in the name, then by stock_quantity (highest first),
+        then insertion order.
+
+        An AND query costs about one bisect per entry of its rarest word's
+        postings for each other word, so a short prefix such as "42" over a
+        million names takes milliseconds, not microseconds.  Other queries
+        grow with the number of hits.  With `limit`, a query whose
+        words each match one indexed word and whose hits are common walks
+        the stock index instead and stops after `limit` hits.
+        """
+        index = self.text_index
+        expanded = [index.expand(token, prefix) for token in tokenize(query)]
+        if limit and limit > 0 and expanded and all(len(terms) == 1 for terms in expanded):
+            if mode == "and" or (mode == "or" and len(expanded) == 1):
+                top = self._search_by_stock(list(dict.fromkeys(terms[0] for terms in expanded)), limit)
+                if top is not None:
+                    return top
+        doc_ids = list(index.match(expanded, mode))
+        terms = list(dict.fromkeys(term for group in expanded for term in group))
+        products = list(map(self._by_seq.__getitem__, doc_ids))
+        # Decorated tuples compare in C; seq is unique, so products never are.
+        keyed = zip(index.scores(doc_ids, terms), map(_STOCK, products), map(operator.neg, doc_ids), products)
+        if limit is not None:
+            ranked = heapq.nlargest(limit, keyed)
+        else:
+            ranked = sorted(keyed, reverse=True)
+        return [entry[3] for entry in ranked]
+
+    def _search_by_stock(self, terms: List[str], limit: int) -> Optional[List[Product]]:
+        """Top `limit` products containing every term, or None if not worth it.
+
+        Apart from the few `boosted` documents, every hit scores len(terms),
+        so hits come out of the stock index already ranked.  Walking it
+        visits about limit * n / hits products.  The walk, and the scan of
+        documents that repeat a word, get the visit budget set by
+        STOCK_WALK_VISITS_PER_POSTING; past it, `match` is cheaper.
+        """
+        index = self.text_index
+        rarest = min(index.document_frequency([term]) for term in terms)
+        budget = rarest * self.STOCK_WALK_VISITS_PER_POSTING
+        # hits <= rarest, so the expected walk is at least limit * n / rarest.
+        if limit * len(self._by_seq) > budget * rarest:
+            return None
+        boosted = index.boosted(terms, budget)
+        if boosted is None:
+            return None
+        by_seq = self._by_seq
+        boosted.sort(key=lambda seq: (-index.term_frequency(seq, terms), -by_seq[seq].stock_quantity, seq))
+        result = boosted[:limit]
+        skip = set(boosted)
+        contains_all = index.contains_all
+        for visited, (_, seq) in enumerate(self.quantity_index.descending_keys()):
+            if len(result) >= limit:
+                break
+            if visited >= budget:
+                return None
+            if seq not in skip and contains_all(seq, terms):
+                result.append(seq)
+        return [by_seq[seq] for seq in result]
+
+    def sort_by_price(self, descending: bool = False) -> List[Product]:
+        """Products by price, read from the price index in O(n) (stable)."""
+        index = self.price_index
+        return index.largest() if descending else index.smallest()
+
+    def sort_by_quantity(self, descending: bool = False) -> List[Product]:
+        """Products by quantity, read from the quantity index in O(n) (stable)."""
+        index = self.quantity_index
+        return index.largest() if descending else index.smallest()
+
+    def price_between(self, lo: float, hi: float) -> List[Product]:
+        """Products priced in [lo, hi], cheapest first, in O(log n + k)."""
+        return self.price_index.between(lo, hi)
+
+    def low_stock(self, threshold: int) -> List[Product]:
+        """Products with stock_quantity <= threshold, lowest first, in O(log n + k)."""
+        return self.quantity_index.between(-math.inf, threshold)
+
+    def top_k(self, k: int, by: str = "price", descending: bool = True) -> List[Product]:
+        """The k products with the highest (or lowest) price or stock_quantity."""
+        if k < 0:
+            raise ValueError("k must be non-negative")
+        indexes = {"price": self.price_index, "stock_quantity": self.quantity_index}
+        if by not in indexes:
+            raise ValueError(f"Cannot rank by {by!r}")
+        index = indexes[by]
+        return index.largest(k) if descending else index.smallest(k)
+
+
+class ColumnarInventory:
+    """Read-optimised inventory stored as parallel NumPy columns.
+
+    Row i is described by ``ids[i]``, ``name_table[name_codes[i]]``,
+    ``prices[i]`` (float64) and ``quantities[i]`` (int64).  Names are
+    interned, so a million products with a few thousand distinct names
+    store each name once.  Sorting, filtering and aggregation run as
+    vectorised NumPy operations.  `Product` objects are only built for the
+    rows a query returns.  Query results follow the same order and tie
+    rules as `Inventory`.
+    """
+
+    def __init__(self, products: Iterable[Product]):
+        if np is None:
+            raise ImportError("ColumnarInventory requires numpy")
+        self.ids: List[str] = []
+        self.name_table: List[str] = []
+        self._name_code: Dict[str, int] = {}
+        self._codes_by_lower: Dict[str, List[int]] = {}
+        self._row_of: Dict[str, int] = {}
+        codes: List[int] = []
+        prices: List[float] = []
+        quantities: List[int] = []
+        for product in products:
+            if product.product_id in self._row_of:
+                raise ValueError(f"Product id {product.product_id!r} already exists")
+            self._row_of[product.product_id] = len(self.ids)
+            self.ids.append(product.product_id)
+            codes.append(self._intern(product.name))
+            prices.append(product.price)
+            quantities.append(product.stock_quantity)
+        self.name_codes = np.array(codes, dtype=np.int32)
+        self.prices = np.array(prices, dtype=np.float64)
+        self.quantities = np.array(quantities, dtype=np.int64)
+
+    @classmethod
+    def from_inventory(cls, inventory: Inventory) -> "ColumnarInventory":
+        return cls(inventory.id_index.values())
+
+    def _intern(self, name: str) -> int:
+        code = self._name_code.get(name)
+        if code is None:
+            code = self._name_code[name] = len(self.name_table)
+            self.name_table.append(name)
+            self._codes_by_lower.setdefault(name.lower(), []).append(code)
+        return code
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def nbytes(self) -> int:
+        """Bytes held by the numeric columns (ids and name table excluded)."""
+        return self.name_codes.nbytes + self.prices.nbytes + self.quantities.nbytes
+
+    def product(self, row: int) -> Product:
+        """Materialise row `row` as a Product (a detached copy)."""
+        return Product(
+            product_id=self.ids[row],
+            name=self.name_table[self.name_codes[row]],
+            price=float(self.prices[row]),
+            stock_quantity=int(self.quantities[row]),
+        )
+
+    def products_at(self, rows: Sequence[int]) -> List[Product]:
+        return [self.product(int(row)) for row in rows]
+
+    def _column(self, by: str):
+        if by == "price":
+            return self.prices
+        if by == "stock_quantity":
+            return self.quantities
+        raise ValueError(f"Cannot rank by {by!r}")
+
+    # ------------------------------------------------------------------
+    # Row-returning queries (arrays of row numbers, no Product objects)
+    # ------------------------------------------------------------------
+
+    def argsort(self, by: str = "price", descending: bool = False):
+        """Row order by `by`; stable, so ties keep insertion order."""
+        column = self._column(by)
+        return np.argsort(-column if descending else column, kind="stable")
+
+    def rows_where(self, mask):
+        """Rows selected by a boolean mask, in insertion order."""
+        return np.flatnonzero(mask)
+
+    def top_k_rows(self, k: int, by: str = "price", descending: bool = True):
+        """Rows of the k highest (or lowest) values in O(n + k log k)."""
+        if k < 0:
+            raise ValueError("k must be non-negative")
+        column = self._column(by)
+        keyed = -column if descending else column
+        if k == 0:
+            return np.empty(0, dtype=np.intp)
+        if k >= len(keyed):
+            return np.argsort(keyed, kind="stable")
+        kth = np.partition(keyed, k - 1)[k - 1]
+        strict = np.flatnonzero(keyed < kth)
+        ties = np.flatnonzero(keyed == kth)[:k - len(strict)]
+        rows = np.concatenate([strict, ties])
+        return rows[np.argsort(keyed[rows], kind="stable")]
+
+    # ------------------------------------------------------------------
+    # Inventory-compatible queries
+    # ------------------------------------------------------------------
+
+    def search_by_id(self, product_id: str) -> Optional[Product]:
+        row = self._row_of.get(product_id)
+        return None if row is None else self.product(row)
+
+    def search_by_name(self, name: str) -> List[Product]:
+        codes = self._codes_by_lower.get(name.lower())
+        if not codes:
+            return []
+        return self.products_at(self.rows_where(np.isin(self.name_codes, codes)))
+
     def sort_by_price(self, descending: bool = False) -> List[Product]:
-        """Sort products by price using merge sort for stable O(n log n) performance."""
-        return merge_sort(self.products, key=lambda p: p.price, descending=descending)
+        return self.products_at(self.argsort("price", descending))
 
     def sort_by_quantity(self, descending: bool = False) -> List[Product]:
-        """Sort products by quantity using merge sort for stable O(n log n) performance."""
-        return merge_sort(self.products, key=lambda p: p.stock_quantity, descending=descending)
+        return self.products_at(self.argsort("stock_quantity", descending))
+
+    def price_between(self, lo: float, hi: float) -> List[Product]:
+        rows = self.rows_where((self.prices >= lo) & (self.prices <= hi))
+        return self.products_at(rows[np.argsort(self.prices[rows], kind="stable")])
+
+    def low_stock(self, threshold: int) -> List[Product]:
+        rows = self.rows_where(self.quantities <= threshold)
+        return self.products_at(rows[np.argsort(self.quantities[rows], kind="stable")])
+
+    def top_k(self, k: int, by: str = "price", descending: bool = True) -> List[Product]:
+        return self.products_at(self.top_k_rows(k, by, descending))
+
+    # ------------------------------------------------------------------
+    # Aggregates
+    # ------------------------------------------------------------------
+
+    def total_stock_value(self) -> float:
+        """Sum of price * stock_quantity over all products."""
+        return float(np.dot(self.prices, self.quantities))
+
+    def price_band_counts(self, edges: Sequence[float]) -> Dict[Tuple[float, float], int]:
+        """Count products in each half-open band [edges[i], edges[i + 1])."""
+        edges_arr = np.asarray(edges, dtype=np.float64)
+        bands = np.searchsorted(edges_arr, self.prices, side="right") - 1
+        in_range = (bands >= 0) & (bands < len(edges_arr) - 1)
+        counts = np.bincount(bands[in_range], minlength=len(edges_arr) - 1)
+        return {
+            (float(edges_arr[i]), float(edges_arr[i + 1])): int(counts[i])
+            for i in range(len(edges_arr) - 1)
+        }
 
 
 def merge_sort(items: List[Product], key, descending: bool = False) -> List[Product]:
@@ -74,7 +745,148 @@ def merge(left: List[Product], right: List[Product], key, descending: bool) -> L
     return merged
 
 
+_ADJECTIVES = ["Blue", "Red", "Steel", "Mini", "Deluxe", "Smart", "Wireless", "Compact"]
+
+
+def generate_products(n: int, seed: int = 0, descriptive: bool = False) -> List[Product]:
+    """Random products; `descriptive` adds adjectives to names ("Blue Mini Widget")."""
+    rng = random.Random(seed)
+    names = ["Widget", "Gadget", "Doodad", "Thingamajig", "Gizmo", "Sprocket"]
+
+    def name() -> str:
+        base = rng.choice(names)
+        if not descriptive:
+            return base
+        return " ".join(rng.sample(_ADJECTIVES, rng.randint(0, 2)) + [base]) + f" {rng.randint(1, 9999)}"
+
+    return [
+        Product(
+            product_id=f"P{i:07d}",
+            name=name(),
+            price=round(rng.uniform(1, 500), 2),
+            stock_quantity=rng.randint(0, 1_000),
+        )
+        for i in range(n)
+    ]
+
+
+def benchmark_mutations(n: int = 200_000, feed_size: int = 100_000) -> None:
+    """Time single-product updates and a bulk feed against a full index rebuild."""
+    inventory = Inventory(generate_products(n))
+    rng = random.Random(1)
+    ids = list(inventory.id_index)
+    print(f"\nMutations on {n:,} products")
+
+    start = time.perf_counter()
+    for _ in range(10_000):
+        inventory.update_stock(rng.choice(ids), rng.randint(0, 1_000))
+    per_update = (time.perf_counter() - start) / 10_000 * 1e6
+    print(f"  update_stock: {per_update:.1f} us per call")
+
+    start = time.perf_counter()
+    Inventory(inventory.products)
+    print(f"  full rebuild: {(time.perf_counter() - start) * 1e3:.0f} ms")
+
+    feed = [("price", rng.choice(ids), round(rng.uniform(1, 500), 2)) for _ in range(feed_size)]
+    start = time.perf_counter()
+    inventory.apply_changes(feed)
+    print(f"  apply_changes({feed_size:,} rows): {(time.perf_counter() - start) * 1e3:.0f} ms")
+
+
+def benchmark_columnar(n: int = 1_000_000) -> None:
+    """Compare memory and query time of Inventory and ColumnarInventory."""
+    if np is None:
+        print("\nnumpy is not installed; skipping the columnar benchmark")
+        return
+    products = generate_products(n)
+    columnar = ColumnarInventory(products)
+    per_product = sys.getsizeof(products[0]) + sys.getsizeof(products[0].__dict__)
+    print(f"\nColumnar store, {n:,} products")
+    print(f"  Product objects: ~{per_product} bytes each (excluding strings)")
+    print(f"  numeric columns: {columnar.nbytes() / n:.0f} bytes per row")
+
+    def timed(label: str, fn) -> None:
+        start = time.perf_counter()
+        fn()
+        print(f"  {label:<34}{(time.perf_counter() - start) * 1e3:>9.1f} ms")
+
+    timed("total value (Python loop)", lambda: sum(p.price * p.stock_quantity for p in products))
+    timed("total_stock_value()", columnar.total_stock_value)
+    timed("sorted(products, key=price)", lambda: sorted(products, key=lambda p: p.price))
+    timed("argsort('price')", lambda: columnar.argsort("price"))
+    timed("top_k_rows(10)", lambda: columnar.top_k_rows(10))
+    timed("price_band_counts(0..500 by 50)",
+          lambda: columnar.price_band_counts(range(0, 501, 50)))
+
+
+def benchmark_text_search(n: int = 1_000_000, repeats: int = 200) -> None:
+    """Time indexing and full-text queries over descriptive product names."""
+    products = generate_products(n, descriptive=True)
+    start = time.perf_counter()
+    inventory = Inventory(products)
+    print(f"\nFull-text search over {n:,} products (build {time.perf_counter() - start:.1f} s)")
+    queries = [
+        ("'wireless' limit=10", dict(query="wireless", limit=10)),
+        ("'blue widget' limit=10", dict(query="blue widget", limit=10)),
+        ("'wid' prefix limit=10", dict(query="wid", limit=10)),
+        ("'blue widget 42' (and)", dict(query="blue widget 42")),
+        ("'blue widget 42' exact (and)", dict(query="blue widget 42", prefix=False)),
+        ("'steel mini gizmo 77' (and)", dict(query="steel mini gizmo 77")),
+        ("'spr 123' prefix (and)", dict(query="spr 123")),
+        ("'4242 1234' (or)", dict(query="4242 1234", mode="or")),
+    ]
+    for label, kwargs in queries:
+        start = time.perf_counter()
+        for _ in range(repeats):
+            hits = inventory.search_text(**kwargs)
+        per_query = (time.perf_counter() - start) / repeats * 1e3
+        print(f"  {label:<32}{per_query:>9.3f} ms  ({len(hits)} hits)")
+    print("  (limit queries on whole words stop early; otherwise cost grows with")
+    print("   the rarest word's postings, summed over its prefix expansions, so")
+    print("   AND queries on short prefixes miss the sub-millisecond target)")
+
+
+def benchmark_queries(n: int = 100_000, repeats: int = 20) -> None:
+    """Compare index-backed queries with re-running merge_sort per query."""
+    products = generate_products(n)
+    start = time.perf_counter()
+    inventory = Inventory(products)
+    build_ms = (time.perf_counter() - start) * 1e3
+    print(f"\nInventory of {n:,} products (index build {build_ms:.0f} ms)")
+    print(f"{'Query':<30}{'merge_sort (ms)':>17}{'index (ms)':>13}")
+
+    def timed(fn) -> float:
+        start = time.perf_counter()
+        for _ in range(repeats):
+            fn()
+        return (time.perf_counter() - start) * 1e3 / repeats
+
+    price = lambda p: p.price
+    qty = lambda p: p.stock_quantity
+    cases = [
+        ("price_between(100, 110)",
+         lambda: [p for p in merge_sort(products, price) if 100 <= p.price <= 110],
+         lambda: inventory.price_between(100, 110)),
+        ("low_stock(5)",
+         lambda: [p for p in merge_sort(products, qty) if p.stock_quantity <= 5],
+         lambda: inventory.low_stock(5)),
+        ("top_k(10, by='price')",
+         lambda: merge_sort(products, price, descending=True)[:10],
+         lambda: inventory.top_k(10)),
+    ]
+    for label, baseline, indexed in cases:
+        assert baseline() == indexed()
+        print(f"{label:<30}{timed(baseline):>17.2f}{timed(indexed):>13.4f}")
+
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--benchmark":
+        benchmark_queries()
+        benchmark_mutations()
+        benchmark_columnar()
+        benchmark_text_search()
+        sys.exit(0)
+
     sample_products = [
         Product(product_id="P1001", name="Widget", price=9.99, stock_quantity=120),
         Product(product_id="P1002", name="Gadget", price=14.99, stock_quantity=80),
@@ -100,3 +912,51 @@ if __name__ == "__main__":
     print("\nProducts sorted by stock quantity descending:")
     for item in inventory.sort_by_quantity(descending=True):
         print(item)
+
+    print("\nProducts priced between 5 and 15:")
+    for item in inventory.price_between(5, 15):
+        print(item)
+
+    print("\nLow stock (50 or fewer):")
+    for item in inventory.low_stock(50):
+        print(item)
+
+    print("\nTop 2 by stock quantity:")
+    for item in inventory.top_k(2, by="stock_quantity"):
+        print(item)
+
+    inventory.add_product(Product(product_id="P1006", name="Gizmo", price=7.49, stock_quantity=10))
+    inventory.update_stock("P1005", 300)
+    inventory.update_price("P1004", 3.99)
+    inventory.remove_product("P1002")
+    print("\nAfter add/restock/reprice/remove, low stock (50 or fewer):")
+    for item in inventory.low_stock(50):
+        print(item)
+    print("Cheapest:", inventory.top_k(1, descending=False)[0])
+
+    inventory.add_product(Product(product_id="P1007", name="Blue Widget Pro", price=19.99, stock_quantity=40))
+    print("\nFull-text search 'wid':")
+    for item in inventory.search_text("wid"):
+        print(item)
+    print("Full-text search 'blue widget':", inventory.search_text("blue widget"))
+
+    # Fields edited directly on a live product must not strand its index entries.
+    edited = inventory.search_by_id("P1006")
+    edited.price = 99.0
+    edited.name = "Renamed Gizmo"
+    inventory.update_price("P1006", 8.49)
+    edited.stock_quantity = 7
+    inventory.remove_product("P1006")
+    if inventory.search_by_id("P1006") is not None or edited in inventory.sort_by_price():
+        raise RuntimeError("Edited product is still indexed after removal")
+    if inventory.search_by_name("gizmo") or inventory.search_text("gizmo"):
+        raise RuntimeError("Edited product is still searchable after removal")
+    expected = sorted(inventory.products, key=lambda item: item.price)
+    if inventory.sort_by_price() != expected or len(inventory.quantity_index) != len(expected):
+        raise RuntimeError("Sorted indexes drifted after removing an edited product")
+    print("\nRemoving a product edited in place left every index consistent")
+
+    if np is not None:
+        columnar = ColumnarInventory.from_inventory(inventory)
+        print("\nColumnar total stock value:", round(columnar.total_stock_value(), 2))
+        print("Columnar price bands:", columnar.price_band_counts([0, 5, 10, 25]))
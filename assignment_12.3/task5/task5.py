@@ -1,8 +1,26 @@
+import csv
+import heapq
+import operator
+import os
 import random
 import string
+import sys
+import tempfile
 import time
+from bisect import bisect_left, insort
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # StockFrame is unavailable without numpy
+    np = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet output is unavailable without pyarrow
+    pa = pq = None
 
 
 @dataclass
@@ -19,20 +37,134 @@ class Stock:
         return ((self.closing_price - self.opening_price) / self.opening_price) * 100
 
 
-def generate_stock_data(count: int) -> List[Stock]:
-    """Generate simulated stock data for analysis."""
-    symbols = set()
-    stocks: List[Stock] = []
-    while len(stocks) < count:
-        symbol = ''.join(random.choices(string.ascii_uppercase, k=3))
-        if symbol in symbols:
-            continue
-        symbols.add(symbol)
-        opening_price = round(random.uniform(10.0, 500.0), 2)
-        change = random.uniform(-0.2, 0.2)
-        closing_price = round(opening_price * (1 + change), 2)
-        stocks.append(Stock(symbol=symbol, opening_price=opening_price, closing_price=closing_price))
-    return stocks
+_U64 = (1 << 64) - 1
+
+
+class _SymbolPermutation:
+    """Seeded bijection on range(size): a 4-round Feistel network with cycle walking.
+
+    The Feistel network permutes the smallest even-bit power of two that
+    covers `size`.  Outputs outside range(size) are encrypted again, which
+    takes fewer than four steps on average.  Each index maps in O(1)
+    without materialising the permutation.
+    """
+
+    def __init__(self, size: int, seed: int):
+        self.size = size
+        bits = max(2, (size - 1).bit_length())
+        self._half = (bits + 1) // 2
+        self._mask = (1 << self._half) - 1
+        rng = random.Random(seed)
+        self._keys = [rng.getrandbits(64) for _ in range(4)]
+
+    def __call__(self, index: int) -> int:
+        half, mask, keys = self._half, self._mask, self._keys
+        x = index
+        while True:
+            left, right = x >> half, x & mask
+            for key in keys:
+                f = ((right ^ key) * 0x9E3779B97F4A7C15) & _U64
+                f ^= f >> 29
+                left, right = right, left ^ (f & mask)
+            x = (left << half) | right
+            if x < self.size:
+                return x
+
+
+def symbol_space(count: int, min_length: int = 3) -> int:
+    """Shortest maximum symbol length whose space holds `count` symbols."""
+    length, capacity = min_length, 26 ** min_length
+    while capacity < count:
+        length += 1
+        capacity += 26 ** length
+    return length
+
+
+def _symbol_at(index: int, min_length: int) -> str:
+    """The index-th symbol of min_length letters, then longer lengths."""
+    length = min_length
+    while index >= 26 ** length:
+        index -= 26 ** length
+        length += 1
+    letters = string.ascii_uppercase
+    chars = []
+    for _ in range(length):
+        index, digit = divmod(index, 26)
+        chars.append(letters[digit])
+    return "".join(reversed(chars))
+
+
+def unique_symbols(count: int, seed: Optional[int] = None, min_length: int = 3) -> Iterator[str]:
+    """Yield `count` distinct symbols in random order in O(count) total time.
+
+    Every symbol of `min_length` letters is used, then every symbol one
+    letter longer, and so on; only the longest length needed is sampled.
+    One permutation picks that sample, a second shuffles the output order.
+    The space therefore grows with `count` and never runs out.  The same
+    seed gives the same sequence.
+    """
+    max_length = symbol_space(count, min_length)
+    shorter = sum(26 ** length for length in range(min_length, max_length))
+    if seed is None:
+        seed = random.getrandbits(64)
+    rng = random.Random(seed)
+    order = _SymbolPermutation(count, rng.getrandbits(64))
+    longest = _SymbolPermutation(26 ** max_length, rng.getrandbits(64))
+    for i in range(count):
+        index = order(i)
+        if index >= shorter:
+            index = shorter + longest(index - shorter)
+        yield _symbol_at(index, min_length)
+
+
+def iter_stock_rows(count: int, seed: Optional[int] = None) -> Iterator[Tuple[str, float, float]]:
+    """Yield (symbol, opening_price, closing_price) rows with unique symbols."""
+    rng = random.Random(seed) if seed is not None else random
+    for symbol in unique_symbols(count, seed):
+        opening_price = round(rng.uniform(10.0, 500.0), 2)
+        change = rng.uniform(-0.2, 0.2)
+        yield symbol, opening_price, round(opening_price * (1 + change), 2)
+
+
+def generate_stock_data(count: int, seed: Optional[int] = None) -> List[Stock]:
+    """Generate simulated stock data for analysis (reproducible when seeded)."""
+    return [
+        Stock(symbol=symbol, opening_price=opening_price, closing_price=closing_price)
+        for symbol, opening_price, closing_price in iter_stock_rows(count, seed)
+    ]
+
+
+def write_stock_dataset(path: str, count: int, seed: Optional[int] = None,
+                        chunk_size: int = 1_000_000) -> int:
+    """Stream `count` generated rows to a .csv or .parquet file, chunk by chunk.
+
+    Memory use is bounded by `chunk_size` rows, whatever `count` is.
+    Parquet output needs pyarrow.  Returns the number of rows written.
+    """
+    is_parquet = path.endswith(".parquet")
+    if is_parquet and pq is None:
+        raise ImportError("Parquet output requires pyarrow")
+    rows = iter_stock_rows(count, seed)
+    written = 0
+    if is_parquet:
+        schema = pa.schema([("symbol", pa.string()), ("opening_price", pa.float64()),
+                            ("closing_price", pa.float64())])
+        with pq.ParquetWriter(path, schema) as writer:
+            while written < count:
+                chunk = [next(rows) for _ in range(min(chunk_size, count - written))]
+                symbols, opens, closes = zip(*chunk)
+                writer.write_table(pa.Table.from_arrays(
+                    [pa.array(symbols), pa.array(opens), pa.array(closes)], schema=schema))
+                written += len(chunk)
+        return written
+    with open(path, "w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["symbol", "opening_price", "closing_price"])
+        while written < count:
+            chunk = [next(rows) for _ in range(min(chunk_size, count - written))]
+            writer.writerows(chunk)
+            written += len(chunk)
+    return written
 
 
 def build_symbol_index(stocks: List[Stock]) -> Dict[str, Stock]:
@@ -40,6 +172,59 @@ def build_symbol_index(stocks: List[Stock]) -> Dict[str, Stock]:
     return {stock.symbol: stock for stock in stocks}
 
 
+class SymbolIndex:
+    """Symbol lookup with ordered scans.
+
+    A dict gives O(1) exact lookup.  A sorted list of symbols answers prefix
+    and range scans with a bisect plus a slice, O(log n + k), so no full
+    sort is needed.  Adding a new symbol is a bisect plus one list insert.
+    Updating an existing symbol only touches the dict.
+    """
+
+    def __init__(self, stocks: Iterable[Stock] = ()):
+        self._by_symbol: Dict[str, Stock] = {stock.symbol: stock for stock in stocks}
+        self._symbols: List[str] = sorted(self._by_symbol)
+
+    def add(self, stock: Stock) -> None:
+        """Insert a new stock or replace the record for its symbol."""
+        if stock.symbol not in self._by_symbol:
+            insort(self._symbols, stock.symbol)
+        self._by_symbol[stock.symbol] = stock
+
+    def remove(self, symbol: str) -> Stock:
+        stock = self._by_symbol.pop(symbol)
+        del self._symbols[bisect_left(self._symbols, symbol)]
+        return stock
+
+    def get(self, symbol: str) -> Optional[Stock]:
+        return self._by_symbol.get(symbol)
+
+    def range(self, start: str = "", stop: Optional[str] = None,
+              limit: Optional[int] = None) -> List[Stock]:
+        """Stocks with start <= symbol < stop, in alphabetical order."""
+        lo = bisect_left(self._symbols, start)
+        hi = len(self._symbols) if stop is None else bisect_left(self._symbols, stop, lo)
+        if limit is not None:
+            hi = min(hi, lo + limit)
+        return [self._by_symbol[symbol] for symbol in self._symbols[lo:hi]]
+
+    def prefix(self, prefix: str, limit: Optional[int] = None) -> List[Stock]:
+        """Stocks whose symbol starts with `prefix`, alphabetically."""
+        return self.range(prefix, prefix + "\U0010ffff", limit)
+
+    def page(self, after: Optional[str] = None, size: int = 50) -> List[Stock]:
+        """Alphabetical pagination: the `size` symbols that follow `after`."""
+        if after is None:
+            return self.range(limit=size)
+        return self.range(after + "\0", limit=size)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._by_symbol
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+
 def heapify(stocks: List[Stock], heap_size: int, root_index: int) -> None:
     """Ensure the subtree rooted at root_index satisfies the max-heap property."""
     largest = root_index
@@ -72,11 +257,315 @@ def heap_sort(stocks: List[Stock], descending: bool = True) -> List[Stock]:
     return data
 
 
-def search_stock(symbol: str, index: Dict[str, Stock]) -> Optional[Stock]:
+def keyed_heap_sort(items: Sequence, key=None, descending: bool = True,
+                    k: Optional[int] = None) -> List:
+    """Iterative heap sort that evaluates `key` once per item.
+
+    Keys are computed up front (decorate-sort-undecorate) and sifted in a
+    parallel list, so a key such as `percentage_change` is never
+    recomputed during comparisons.  With `k`, only the first k items of the
+    ordering are extracted: O(n + k log n) instead of O(n log n).
+    """
+    if key is None:
+        key = lambda item: item.percentage_change
+    keys = [key(item) for item in items]
+    data = list(items)
+    n = len(data)
+    count = n if k is None else max(0, min(k, n))
+    # Max-heap for descending output, min-heap for ascending.
+    before = operator.gt if descending else operator.lt
+
+    def sift_down(root: int, size: int) -> None:
+        root_key, root_item = keys[root], data[root]
+        child = 2 * root + 1
+        while child < size:
+            right = child + 1
+            if right < size and before(keys[right], keys[child]):
+                child = right
+            if not before(keys[child], root_key):
+                break
+            keys[root], data[root] = keys[child], data[child]
+            root = child
+            child = 2 * root + 1
+        keys[root], data[root] = root_key, root_item
+
+    for i in range(n // 2 - 1, -1, -1):
+        sift_down(i, n)
+
+    result = []
+    size = n
+    for _ in range(count):
+        result.append(data[0])
+        size -= 1
+        if size:
+            keys[0], data[0] = keys[size], data[size]
+            sift_down(0, size)
+    return result
+
+
+def search_stock(symbol: str, index: Union[Dict[str, Stock], SymbolIndex]) -> Optional[Stock]:
     """Search for a stock symbol using a hash-map for O(1) average lookup."""
     return index.get(symbol)
 
 
+class _BoundedBoard:
+    """The k symbols with the largest keys, kept in a size-k min-heap.
+
+    A heap entry is stale once its symbol's key has changed.  Stale entries
+    are skipped at the root and cleared out when the heap doubles in size.
+    If a member's key drops below the board threshold, an outsider may now
+    belong on the board.  The board is then marked dirty and rebuilt from
+    all keys on the next read.
+    """
+
+    def __init__(self, k: int):
+        self.k = k
+        self._heap: List[Tuple[float, str]] = []
+        self.members: Dict[str, float] = {}
+        self.dirty = False
+
+    def _threshold(self) -> float:
+        heap, members = self._heap, self.members
+        while members.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0][0]
+
+    def _push(self, symbol: str, key: float) -> None:
+        self.members[symbol] = key
+        heapq.heappush(self._heap, (key, symbol))
+        if len(self._heap) > 2 * self.k + 8:
+            self._heap = [(key, sym) for sym, key in self.members.items()]
+            heapq.heapify(self._heap)
+
+    def update(self, symbol: str, key: float) -> None:
+        if self.dirty:
+            return
+        members = self.members
+        old = members.get(symbol)
+        if old is not None:
+            if key < old and len(members) >= self.k and key < self._threshold():
+                self.dirty = True
+            self._push(symbol, key)
+        elif len(members) < self.k:
+            self._push(symbol, key)
+        elif key > self._threshold():
+            evicted = heapq.heappop(self._heap)[1]
+            del members[evicted]
+            self._push(symbol, key)
+
+    def rebuild(self, keys: Dict[str, float]) -> None:
+        best = heapq.nlargest(self.k, keys.items(), key=lambda item: item[1])
+        self.members = dict(best)
+        self._heap = [(key, symbol) for symbol, key in best]
+        heapq.heapify(self._heap)
+        self.dirty = False
+
+    def ranked(self) -> List[Tuple[str, float]]:
+        """Members by descending key, ties broken by symbol."""
+        return sorted(self.members.items(), key=lambda item: (-item[1], item[0]))
+
+
+class StreamingLeaderboard:
+    """Top-k gainers and losers maintained tick by tick.
+
+    The first tick for a symbol fixes its opening price unless one is
+    given.  Every tick computes that symbol's percentage change once and
+    updates both bounded boards in O(log k).  The one exception is a board
+    member falling below the k-th best.  That board is then re-ranked from
+    the per-symbol changes (O(n log k)) the next time it is read.
+    """
+
+    def __init__(self, k: int = 5):
+        if k <= 0:
+            raise ValueError("k must be positive")
+        self.k = k
+        self._open: Dict[str, float] = {}
+        self._last: Dict[str, float] = {}
+        self._gain: Dict[str, float] = {}
+        self._loss: Dict[str, float] = {}
+        self._gainers = _BoundedBoard(k)
+        self._losers = _BoundedBoard(k)
+
+    def ingest(self, symbol: str, price: float, opening_price: Optional[float] = None) -> None:
+        """Record a price tick for `symbol`."""
+        opening = self._open.get(symbol)
+        if opening is None:
+            opening = self._open[symbol] = price if opening_price is None else opening_price
+        self._last[symbol] = price
+        change = 0.0 if opening == 0 else (price - opening) / opening * 100
+        self._gain[symbol] = change
+        self._loss[symbol] = -change
+        self._gainers.update(symbol, change)
+        self._losers.update(symbol, -change)
+
+    def ingest_many(self, ticks: Iterable[Tuple[str, float]]) -> None:
+        for symbol, price in ticks:
+            self.ingest(symbol, price)
+
+    def ingest_stock(self, stock: Stock) -> None:
+        self.ingest(stock.symbol, stock.closing_price, stock.opening_price)
+
+    def _stock(self, symbol: str) -> Stock:
+        return Stock(symbol=symbol, opening_price=self._open[symbol], closing_price=self._last[symbol])
+
+    def top_stocks(self) -> List[Stock]:
+        """Top gainers, best first."""
+        if self._gainers.dirty:
+            self._gainers.rebuild(self._gain)
+        return [self._stock(symbol) for symbol, _ in self._gainers.ranked()]
+
+    def bottom_stocks(self) -> List[Stock]:
+        """Top losers, ordered like the tail of a descending sort (worst last)."""
+        if self._losers.dirty:
+            self._losers.rebuild(self._loss)
+        return [self._stock(symbol) for symbol, _ in reversed(self._losers.ranked())]
+
+    def __len__(self) -> int:
+        return len(self._open)
+
+
+def generate_ticks(stocks: List[Stock], count: int, seed: int = 0) -> Iterable[Tuple[str, float]]:
+    """Random-walk price ticks for `stocks`, starting at their opening prices."""
+    rng = random.Random(seed)
+    prices = {stock.symbol: stock.opening_price for stock in stocks}
+    symbols = list(prices)
+    for _ in range(count):
+        symbol = rng.choice(symbols)
+        price = round(max(0.01, prices[symbol] * (1 + rng.uniform(-0.01, 0.01))), 2)
+        prices[symbol] = price
+        yield symbol, price
+
+
+class StockFrame:
+    """Array-backed stock table: symbols, opening and closing prices as columns.
+
+    Percentage changes for every row are computed in one vectorised pass
+    and cached.  top_k/bottom_k use `argpartition` and sort only the k
+    selected rows.  Rows come back as `Stock` objects on demand.
+    """
+
+    def __init__(self, symbols: Sequence, opens, closes):
+        if np is None:
+            raise ImportError("StockFrame requires numpy")
+        self.symbols = symbols
+        self.opens = np.asarray(opens, dtype=np.float64)
+        self.closes = np.asarray(closes, dtype=np.float64)
+        if not (len(symbols) == len(self.opens) == len(self.closes)):
+            raise ValueError("symbols, opens and closes must have the same length")
+        self._changes = None
+
+    @classmethod
+    def from_stocks(cls, stocks: List[Stock]) -> "StockFrame":
+        return cls(
+            [stock.symbol for stock in stocks],
+            [stock.opening_price for stock in stocks],
+            [stock.closing_price for stock in stocks],
+        )
+
+    @classmethod
+    def random(cls, count: int, seed: Optional[int] = None) -> "StockFrame":
+        """Vectorised counterpart of generate_stock_data.
+
+        Symbols are distinct fixed-width letter codes (bytes), wide enough for `count`.
+        """
+        rng = np.random.default_rng(seed)
+        width = 3
+        while 26 ** width < count:
+            width += 1
+        codes = rng.permutation(count)
+        letters = np.empty((count, width), dtype=np.uint8)
+        for pos in range(width - 1, -1, -1):
+            letters[:, pos] = 65 + codes % 26
+            codes //= 26
+        symbols = letters.view(f"S{width}").ravel()
+        opens = np.round(rng.uniform(10.0, 500.0, count), 2)
+        closes = np.round(opens * (1 + rng.uniform(-0.2, 0.2, count)), 2)
+        return cls(symbols, opens, closes)
+
+    def __len__(self) -> int:
+        return len(self.opens)
+
+    def percentage_changes(self):
+        """Percentage change per row (0.0 where the opening price is 0)."""
+        if self._changes is None:
+            changes = np.zeros_like(self.opens)
+            np.divide(self.closes - self.opens, self.opens, out=changes, where=self.opens != 0)
+            changes *= 100
+            self._changes = changes
+        return self._changes
+
+    def top_k_rows(self, k: int):
+        """Rows of the k largest changes, best first."""
+        changes = self.percentage_changes()
+        k = min(k, len(changes))
+        if k <= 0:
+            return np.empty(0, dtype=np.intp)
+        rows = np.argpartition(-changes, k - 1)[:k]
+        return rows[np.argsort(-changes[rows], kind="stable")]
+
+    def bottom_k_rows(self, k: int):
+        """Rows of the k smallest changes, ordered best to worst (worst last)."""
+        changes = self.percentage_changes()
+        k = min(k, len(changes))
+        if k <= 0:
+            return np.empty(0, dtype=np.intp)
+        rows = np.argpartition(changes, k - 1)[:k]
+        return rows[np.argsort(-changes[rows], kind="stable")]
+
+    def stock(self, row: int) -> Stock:
+        symbol = self.symbols[row]
+        if isinstance(symbol, bytes):
+            symbol = symbol.decode("ascii")
+        return Stock(symbol=str(symbol), opening_price=float(self.opens[row]),
+                     closing_price=float(self.closes[row]))
+
+    def top_stocks(self, k: int = 5) -> List[Stock]:
+        return [self.stock(int(row)) for row in self.top_k_rows(k)]
+
+    def bottom_stocks(self, k: int = 5) -> List[Stock]:
+        return [self.stock(int(row)) for row in self.bottom_k_rows(k)]
+
+
+def benchmark_symbol_generation(count: int = 1_000_000) -> None:
+    """Time unique symbol generation and chunked CSV output."""
+    print(f"\nUnique symbol generation, {count:,} symbols "
+          f"(up to {symbol_space(count)} letters)")
+    start = time.perf_counter()
+    for _ in unique_symbols(count, seed=0):
+        pass
+    symbol_time = time.perf_counter() - start
+    print(f"  unique_symbols: {symbol_time:.2f} s ({count / symbol_time:,.0f} symbols/s)")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "stocks.csv")
+        start = time.perf_counter()
+        write_stock_dataset(path, count, seed=0, chunk_size=100_000)
+        csv_time = time.perf_counter() - start
+        size_mb = os.path.getsize(path) / 1e6
+    print(f"  write_stock_dataset (CSV): {csv_time:.2f} s, {size_mb:.0f} MB")
+
+
+def benchmark_stockframe(count: int = 10_000_000) -> None:
+    """Time StockFrame's vectorised changes and top/bottom-k at large scale."""
+    if np is None:
+        print("\nnumpy is not installed; skipping the StockFrame benchmark")
+        return
+    start = time.perf_counter()
+    frame = StockFrame.random(count, seed=0)
+    build_time = time.perf_counter() - start
+    print(f"\nStockFrame with {count:,} rows (generated in {build_time:.2f} s)")
+    print(f"{'Step':<28}{'Time (s)':>10}")
+    start = time.perf_counter()
+    frame.percentage_changes()
+    changes_time = time.perf_counter() - start
+    start = time.perf_counter()
+    frame.top_k_rows(5)
+    frame.bottom_k_rows(5)
+    topk_time = time.perf_counter() - start
+    print(f"{'percentage_changes()':<28}{changes_time:>10.3f}")
+    print(f"{'top_k + bottom_k (k=5)':<28}{topk_time:>10.3f}")
+    print(f"{'total':<28}{changes_time + topk_time:>10.3f}")
+
+
 def benchmark_sorting(stocks: List[Stock]) -> None:
     """Compare the performance of heap sort against Python's built-in sorted."""
     print("\nSorting performance comparison:")
@@ -92,9 +581,20 @@ def benchmark_sorting(stocks: List[Stock]) -> None:
     builtin_time = time.perf_counter() - start
     print(f"{'Built-in sorted()':<20}{builtin_time:>12.6f}")
 
+    start = time.perf_counter()
+    keyed_heap_sort(stocks)
+    keyed_time = time.perf_counter() - start
+    print(f"{'Keyed heap sort':<20}{keyed_time:>12.6f}")
+
+    start = time.perf_counter()
+    keyed_heap_sort(stocks, k=5)
+    partial_time = time.perf_counter() - start
+    print(f"{'Keyed heap, top 5':<20}{partial_time:>12.6f}")
+
     print("\nTrade-offs:")
     print("- Heap Sort: O(n log n) worst-case, no extra temporary sort data structure beyond the copy, but slower in Python due to manual loops.")
     print("- built-in sorted(): also O(n log n), highly optimized in C, and generally faster for Python objects.")
+    print("- Keyed heap sort: iterative, computes each key once; with k it stops after k extractions (O(n + k log n)).")
 
 
 def benchmark_search(index: Dict[str, Stock], symbols: List[str]) -> None:
@@ -108,9 +608,90 @@ def benchmark_search(index: Dict[str, Stock], symbols: List[str]) -> None:
     dict_time = time.perf_counter() - start
     print(f"{'Hash map lookup':<20}{dict_time:>12.6f}")
 
+    ordered = index if isinstance(index, SymbolIndex) else SymbolIndex(index.values())
+    plain = index if isinstance(index, dict) else {stock.symbol: stock for stock in ordered.range()}
+    prefixes = [symbol[:2] for symbol in symbols]
+
+    start = time.perf_counter()
+    for symbol in symbols:
+        _ = search_stock(symbol, ordered)
+    ordered_time = time.perf_counter() - start
+    print(f"{'SymbolIndex lookup':<20}{ordered_time:>12.6f}")
+
+    start = time.perf_counter()
+    for prefix in prefixes:
+        _ = [plain[s] for s in sorted(s for s in plain if s.startswith(prefix))]
+    scan_prefix_time = time.perf_counter() - start
+    print(f"{'Prefix: dict scan':<20}{scan_prefix_time:>12.6f}")
+
+    start = time.perf_counter()
+    for prefix in prefixes:
+        _ = ordered.prefix(prefix)
+    prefix_time = time.perf_counter() - start
+    print(f"{'Prefix: SymbolIndex':<20}{prefix_time:>12.6f}")
+
+    start = time.perf_counter()
+    for symbol in symbols:
+        _ = [plain[s] for s in sorted(plain) if s >= symbol][:50]
+    sort_range_time = time.perf_counter() - start
+    print(f"{'Range: sort + cut':<20}{sort_range_time:>12.6f}")
+
+    start = time.perf_counter()
+    for symbol in symbols:
+        _ = ordered.range(symbol, limit=50)
+    range_time = time.perf_counter() - start
+    print(f"{'Range: SymbolIndex':<20}{range_time:>12.6f}")
+
     print("\nTrade-offs:")
     print("- Hash map lookup: O(1) average time per search, ideal for instant symbol retrieval.")
     print("- Linear search: O(n), not acceptable for thousands of stocks.")
+    print("- SymbolIndex: O(1) lookup plus O(log n + k) prefix/range scans from a sorted symbol list.")
+
+
+def benchmark_streaming(symbol_count: int = 2000, tick_count: int = 10_000_000,
+                        refresh_every: int = 100_000) -> None:
+    """Compare the streaming leaderboard with re-running heap_sort per refresh."""
+    stocks = generate_stock_data(symbol_count)
+    refreshes = tick_count // refresh_every
+    print(f"\nStreaming top/bottom 5: {tick_count:,} ticks over {symbol_count:,} symbols,")
+    print(f"leaderboards read every {refresh_every:,} ticks ({refreshes} refreshes)")
+
+    board = StreamingLeaderboard(k=5)
+    for stock in stocks:
+        board.ingest(stock.symbol, stock.opening_price)
+    start = time.perf_counter()
+    for i, (symbol, price) in enumerate(generate_ticks(stocks, tick_count), 1):
+        board.ingest(symbol, price)
+        if i % refresh_every == 0:
+            board.top_stocks()
+            board.bottom_stocks()
+    stream_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in generate_ticks(stocks, tick_count):
+        pass
+    tick_overhead = time.perf_counter() - start
+
+    # heap_sort baseline: keep the latest price per symbol, re-sort on each refresh.
+    latest = {stock.symbol: Stock(stock.symbol, stock.opening_price, stock.opening_price) for stock in stocks}
+    start = time.perf_counter()
+    for i, (symbol, price) in enumerate(generate_ticks(stocks, tick_count), 1):
+        latest[symbol].closing_price = price
+        if i % refresh_every == 0:
+            ranked = heap_sort(list(latest.values()))
+            top, bottom = ranked[:5], ranked[-5:]
+    sort_time = time.perf_counter() - start
+
+    if refreshes:
+        changes = lambda board_stocks: [round(stock.percentage_change, 9) for stock in board_stocks]
+        if changes(top) != changes(board.top_stocks()) or changes(bottom) != changes(board.bottom_stocks()):
+            raise RuntimeError("StreamingLeaderboard disagrees with heap_sort after the last refresh")
+
+    print(f"{'Approach (excl. tick gen)':<38}{'Time (s)':>10}")
+    print(f"{'StreamingLeaderboard':<38}{stream_time - tick_overhead:>10.2f}")
+    print(f"{'heap_sort per refresh':<38}{sort_time - tick_overhead:>10.2f}")
+    print("The leaderboard's cost is per tick, so it stays current after every tick;")
+    print("heap_sort's cost is per refresh and grows with how often boards are read.")
 
 
 def print_top_stocks(sorted_stocks: List[Stock], top_n: int = 5) -> None:
@@ -130,6 +711,15 @@ def print_bottom_stocks(sorted_stocks: List[Stock], bottom_n: int = 5) -> None:
 
 
 def main() -> None:
+    # One past the 3-letter space: all 17,576 three-letter symbols plus one 4-letter one.
+    lengths: Dict[int, int] = {}
+    symbols = set()
+    for symbol in unique_symbols(26 ** 3 + 1, seed=0):
+        lengths[len(symbol)] = lengths.get(len(symbol), 0) + 1
+        symbols.add(symbol)
+    if lengths != {3: 26 ** 3, 4: 1} or len(symbols) != 26 ** 3 + 1:
+        raise RuntimeError(f"unique_symbols used lengths {lengths} before exhausting 3 letters")
+
     sample_stocks = generate_stock_data(2000)
     symbol_index = build_symbol_index(sample_stocks)
 
@@ -147,6 +737,36 @@ def main() -> None:
     print(f"\nInstant search result for symbol {query}:")
     print(found)
 
+    ordered_index = SymbolIndex(sample_stocks)
+    ordered_index.add(Stock(symbol="AAAA", opening_price=12.0, closing_price=13.5))
+    print(f"\nSymbols starting with {query[:2]}:",
+          [stock.symbol for stock in ordered_index.prefix(query[:2])])
+    print("First page of symbols:", [stock.symbol for stock in ordered_index.page(size=5)])
+
+    if np is not None:
+        frame = StockFrame.from_stocks(sample_stocks)
+        print("\nStockFrame top 5 (argpartition):")
+        print_top_stocks(frame.top_stocks(5), top_n=5)
+
+    board = StreamingLeaderboard(k=5)
+    for stock in sample_stocks:
+        board.ingest_stock(stock)
+    board.ingest_many(generate_ticks(sorted_heap[:5], 200, seed=1))
+    print("\nStreaming leaderboard after 200 more ticks on today's top gainers:")
+    print_top_stocks(board.top_stocks(), top_n=5)
+    print_bottom_stocks(board.bottom_stocks(), bottom_n=5)
+
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--dataset":
+        # python task5.py --dataset stocks.csv|stocks.parquet COUNT [SEED]
+        out_path, row_count = sys.argv[2], int(sys.argv[3])
+        row_seed = int(sys.argv[4]) if len(sys.argv) > 4 else None
+        print(f"Wrote {write_stock_dataset(out_path, row_count, row_seed):,} rows to {out_path}")
+        sys.exit(0)
+    if len(sys.argv) > 1 and sys.argv[1] == "--benchmark":
+        benchmark_symbol_generation()
+        benchmark_streaming()
+        benchmark_stockframe()
+        sys.exit(0)
     main()